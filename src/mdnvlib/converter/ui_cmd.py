@@ -17,6 +17,7 @@ class UiCmd(Ui):
         set_info_what(message) -- show what the converter is going to do.
         show_warning(message) -- Display a warning message.
     """
+    _WARNING = _('WARNING')
 
     def __init__(self, title):
         """Print the title.
@@ -37,7 +38,7 @@ class UiCmd(Ui):
             
         Overrides the superclass method.       
         """
-        result = input(f'{_("WARNING")}: {text} (y/n)')
+        result = input(f'{self._WARNING}: {text} (y/n)')
         if result.lower() == 'y':
             return True
         else:
@@ -8,10 +8,14 @@ License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
 """
 from abc import ABC
 import os
-from urllib.parse import quote
+from urllib.parse import quote_from_bytes
 
 from mdnvlib.novx_globals import _
 
+_PATH_SAFE = b'/:'
+_NAME_SAFE = b'/'
+# Characters not to be URL-encoded in project paths and names.
+
 
 class File(ABC):
     """Abstract novel file representation.
@@ -25,6 +29,20 @@ class File(ABC):
     SUFFIX = None
     # To be extended by subclass methods.
 
+    _FILE_ENDING = 'None'
+    _FILE_ENDING_LOWER = 'none'
+    # SUFFIX and EXTENSION, precomputed per class.
+
+    def __init_subclass__(cls, **kwargs):
+        """Precompute the file ending for the filePath setter."""
+        super().__init_subclass__(**kwargs)
+        if cls.SUFFIX is not None:
+            suffix = cls.SUFFIX
+        else:
+            suffix = ''
+        cls._FILE_ENDING = f'{suffix}{cls.EXTENSION}'
+        cls._FILE_ENDING_LOWER = cls._FILE_ENDING.lower()
+
     def __init__(self, filePath, **kwargs):
         """Initialize instance variables.
 
@@ -56,19 +74,18 @@ class File(ABC):
         - Accept only filenames with the right suffix and extension.
         """
         filePath = filePath.replace('\\', '/')
-        if self.SUFFIX is not None:
-            suffix = self.SUFFIX
-        else:
-            suffix = ''
-        if filePath.lower().endswith(f'{suffix}{self.EXTENSION}'.lower()):
+        if filePath.lower().endswith(self._FILE_ENDING_LOWER):
             self._filePath = filePath
             try:
                 head, tail = os.path.split(os.path.realpath(filePath))
                 # realpath() completes relative paths, but may not work on virtual file systems.
             except:
                 head, tail = os.path.split(filePath)
-            self.projectPath = quote(head.replace('\\', '/'), '/:')
-            self.projectName = quote(tail.replace(f'{suffix}{self.EXTENSION}', ''))
+            if os.sep != '/':
+                head = head.replace('\\', '/')
+                # realpath() restores the native path separators
+            self.projectPath = quote_from_bytes(head.encode('utf-8'), _PATH_SAFE)
+            self.projectName = quote_from_bytes(tail.replace(self._FILE_ENDING, '').encode('utf-8'), _NAME_SAFE)
 
     def is_locked(self):
         """Return True if the file is locked by its application."""
@@ -7,10 +7,12 @@ For further information see https://github.com/peter88213/mdnvlib
 License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
 """
 import os
-from string import Template
+import shutil
+import tempfile
 
 from mdnvlib.file.file import File
 from mdnvlib.file.filter import Filter
+from mdnvlib.file.safe_template import SafeTemplate
 from mdnvlib.model.character import Character
 from mdnvlib.model.section import Section
 from mdnvlib.novx_globals import CHARACTERS_SUFFIX
@@ -27,7 +29,6 @@ from mdnvlib.novx_globals import PN_ROOT
 from mdnvlib.novx_globals import SECTIONS_SUFFIX
 from mdnvlib.novx_globals import WEEKDAYS
 from mdnvlib.novx_globals import _
-from mdnvlib.novx_globals import list_to_string
 from mdnvlib.novx_globals import norm_path
 
 
@@ -59,7 +60,20 @@ class FileExport(File):
     _projectNoteTemplate = ''
     _arcTemplate = ''
 
+    _PLOT_PROGRESS = _('Plot progress')
+    _CHARACTERIZATION = _('Characterization')
+    _WORLD_BUILDING = _('World building')
+    _GOAL = _('Opening')
+    _CONFLICT = _('Peak em. moment')
+    _OUTCOME = _('Ending')
+    _CHR_BIO = _('Bio')
+    _CHR_GOALS = _('Goals')
+    _DAY = _('Day')
+    # Labels translated once at import instead of per mapping.
+
     _DIVIDER = ', '
+    _BUFFER_SIZE = 1 << 17
+    # Write buffer in bytes; large enough for few system calls per export.
 
     def __init__(self, filePath, **kwargs):
         """Initialize filter strategy class instances.
@@ -80,6 +94,16 @@ class FileExport(File):
         self.itemFilter = Filter()
         self.arcFilter = Filter()
         self.turningPointFilter = Filter()
+        self._templates = {}
+        # SafeTemplate instances, cached by template string.
+        self._renamings = None
+        # Tuple of custom or default labels, computed once per export.
+        self._commonMapping = None
+        # Placeholder values shared by all element mappings, computed once per export.
+        self._dateFields = {}
+        # key: iso date, value: tuple of date placeholder values
+        self._timeFields = {}
+        # key: iso time, value: tuple of time placeholder values
 
     def write(self):
         """Write instance variables to the export file.
@@ -88,21 +112,45 @@ class FileExport(File):
         Return a message in case of success.
         Raise the "Error" exception in case of error. 
         """
-        text = self._get_text()
-        backedUp = False
+        lines = self._get_lines()
+        # Build all parts before touching the file, but skip joining them.
+        try:
+            fd, tempPath = tempfile.mkstemp(
+                suffix='.tmp',
+                prefix=f'{os.path.basename(self.filePath)}.',
+                dir=os.path.dirname(os.path.abspath(self.filePath)),
+                )
+            # same directory, so that the final replace is a rename on the same file system
+        except OSError:
+            raise Error(f'{_("Cannot write file")}: "{norm_path(self.filePath)}".')
+
+        try:
+            with open(fd, 'w', encoding='utf-8', buffering=self._BUFFER_SIZE) as f:
+                f.writelines(lines)
+            if os.path.isfile(self.filePath):
+                shutil.copymode(self.filePath, tempPath)
+            else:
+                umask = os.umask(0)
+                os.umask(umask)
+                os.chmod(tempPath, 0o666 & ~umask)
+            # mkstemp() creates the file readable for the owner only
+        except:
+            self._remove_file(tempPath)
+            raise Error(f'{_("Cannot write file")}: "{norm_path(self.filePath)}".')
+
         if os.path.isfile(self.filePath):
             try:
-                os.replace(self.filePath, f'{self.filePath}.bak')
+                shutil.copy2(self.filePath, f'{self.filePath}.bak')
             except:
+                self._remove_file(tempPath)
                 raise Error(f'{_("Cannot overwrite file")}: "{norm_path(self.filePath)}".')
-            else:
-                backedUp = True
+
         try:
-            with open(self.filePath, 'w', encoding='utf-8') as f:
-                f.write(text)
+            os.replace(tempPath, self.filePath)
+            # the only step that changes the target path;
+            # it holds either the complete old or the complete new file at any time
         except:
-            if backedUp:
-                os.replace(f'{self.filePath}.bak', self.filePath)
+            self._remove_file(tempPath)
             raise Error(f'{_("Cannot write file")}: "{norm_path(self.filePath)}".')
 
     def _convert_from_mdnov(self, text, **kwargs):
@@ -130,13 +178,13 @@ class FileExport(File):
         
         This is a template method that can be extended or overridden by subclasses.
         """
+        plotLine = self.novel.plotLines[plId]
         arcMapping = dict(
+            self._get_commonMapping(),
             ID=plId,
-            Title=self._convert_from_mdnov(self.novel.plotLines[plId].title, quick=True),
-            Desc=self._convert_from_mdnov(self.novel.plotLines[plId].desc),
-            Notes=self._convert_from_mdnov(self.novel.plotLines[plId].notes),
-            ProjectName=self._convert_from_mdnov(self.projectName, quick=True),
-            ProjectPath=self.projectPath,
+            Title=self._convert_from_mdnov(plotLine.title, quick=True),
+            Desc=self._convert_from_mdnov(plotLine.desc),
+            Notes=self._convert_from_mdnov(plotLine.notes),
         )
         return arcMapping
 
@@ -153,7 +201,7 @@ class FileExport(File):
         for plId in self.novel.tree.get_children(PL_ROOT):
             if self.arcFilter.accept(self, plId):
                 if self._arcTemplate:
-                    template = Template(self._arcTemplate)
+                    template = self._get_template(self._arcTemplate)
                     lines.append(template.safe_substitute(self._get_arcMapping(plId)))
         return lines
 
@@ -166,17 +214,17 @@ class FileExport(File):
         
         This is a template method that can be extended or overridden by subclasses.
         """
+        chapter = self.novel.chapters[chId]
         if chapterNumber == 0:
             chapterNumber = ''
 
         chapterMapping = dict(
+            self._get_commonMapping(),
             ID=chId,
             ChapterNumber=chapterNumber,
-            Title=self._convert_from_mdnov(self.novel.chapters[chId].title, quick=True),
-            Desc=self._convert_from_mdnov(self.novel.chapters[chId].desc),
-            Notes=self._convert_from_mdnov(self.novel.chapters[chId].notes),
-            ProjectName=self._convert_from_mdnov(self.projectName, quick=True),
-            ProjectPath=self.projectPath,
+            Title=self._convert_from_mdnov(chapter.title, quick=True),
+            Desc=self._convert_from_mdnov(chapter.desc),
+            Notes=self._convert_from_mdnov(chapter.notes),
         )
         return chapterMapping
 
@@ -194,6 +242,7 @@ class FileExport(File):
         chapterNumber = 0
         sectionNumber = 0
         wordsTotal = 0
+        chapters = self.novel.chapters
         for chId in self.novel.tree.get_children(CH_ROOT):
             dispNumber = 0
             if not self.chapterFilter.accept(self, chId):
@@ -202,15 +251,16 @@ class FileExport(File):
             # The order counts; be aware that "Todo" and "Notes" chapters are
             # always unused.
             # Has the chapter only sections not to be exported?
+            chapter = chapters[chId]
             template = None
-            if self.novel.chapters[chId].chType == 1:
+            if chapter.chType == 1:
                 # Chapter is "unused" type.
                 if self._unusedChapterTemplate:
-                    template = Template(self._unusedChapterTemplate)
-            elif self.novel.chapters[chId].chLevel == 1 and self._partTemplate:
-                template = Template(self._partTemplate)
+                    template = self._get_template(self._unusedChapterTemplate)
+            elif chapter.chLevel == 1 and self._partTemplate:
+                template = self._get_template(self._partTemplate)
             else:
-                template = Template(self._chapterTemplate)
+                template = self._get_template(self._chapterTemplate)
                 chapterNumber += 1
                 dispNumber = chapterNumber
             if template is not None:
@@ -222,11 +272,11 @@ class FileExport(File):
 
             #--- Process chapter ending.
             template = None
-            if self.novel.chapters[chId].chType == 1:
+            if chapter.chType == 1:
                 if self._unusedChapterEndTemplate:
-                    template = Template(self._unusedChapterEndTemplate)
+                    template = self._get_template(self._unusedChapterEndTemplate)
             elif self._chapterEndTemplate:
-                template = Template(self._chapterEndTemplate)
+                template = self._get_template(self._chapterEndTemplate)
             if template is not None:
                 lines.append(template.safe_substitute(self._get_chapterMapping(chId, dispNumber)))
         return lines
@@ -239,11 +289,12 @@ class FileExport(File):
         
         This is a template method that can be extended or overridden by subclasses.
         """
-        if self.novel.characters[crId].tags is not None:
-            tags = list_to_string(self.novel.characters[crId].tags, divider=self._DIVIDER)
+        character = self.novel.characters[crId]
+        if character.tags is not None:
+            tags = self._DIVIDER.join(character.tags)
         else:
             tags = ''
-        if self.novel.characters[crId].isMajor:
+        if character.isMajor:
             characterStatus = Character.MAJOR_MARKER
         else:
             characterStatus = Character.MINOR_MARKER
@@ -251,18 +302,17 @@ class FileExport(File):
         __, __, __, __, __, __, chrBio, chrGls = self._get_renamings()
 
         characterMapping = dict(
+            self._get_commonMapping(),
             ID=crId,
-            Title=self._convert_from_mdnov(self.novel.characters[crId].title, quick=True),
-            Desc=self._convert_from_mdnov(self.novel.characters[crId].desc),
+            Title=self._convert_from_mdnov(character.title, quick=True),
+            Desc=self._convert_from_mdnov(character.desc),
             Tags=self._convert_from_mdnov(tags),
-            AKA=self._convert_from_mdnov(self.novel.characters[crId].aka, quick=True),
-            Notes=self._convert_from_mdnov(self.novel.characters[crId].notes),
-            Bio=self._convert_from_mdnov(self.novel.characters[crId].bio),
-            Goals=self._convert_from_mdnov(self.novel.characters[crId].goals),
-            FullName=self._convert_from_mdnov(self.novel.characters[crId].fullName, quick=True),
+            AKA=self._convert_from_mdnov(character.aka, quick=True),
+            Notes=self._convert_from_mdnov(character.notes),
+            Bio=self._convert_from_mdnov(character.bio),
+            Goals=self._convert_from_mdnov(character.goals),
+            FullName=self._convert_from_mdnov(character.fullName, quick=True),
             Status=characterStatus,
-            ProjectName=self._convert_from_mdnov(self.projectName, quick=True),
-            ProjectPath=self.projectPath,
             CharactersSuffix=CHARACTERS_SUFFIX,
             CustomChrBio=chrBio,
             CustomChrGoals=chrGls
@@ -282,12 +332,24 @@ class FileExport(File):
             lines = [self._characterSectionHeading]
         else:
             lines = []
-        template = Template(self._characterTemplate)
+        template = self._get_template(self._characterTemplate)
         for crId in self.novel.tree.get_children(CR_ROOT):
             if self.characterFilter.accept(self, crId):
                 lines.append(template.safe_substitute(self._get_characterMapping(crId)))
         return lines
 
+    def _get_commonMapping(self):
+        """Return a mapping dictionary with the values shared by all elements.
+        
+        The dictionary is created once per export and must not be modified.
+        """
+        if self._commonMapping is None:
+            self._commonMapping = dict(
+                ProjectName=self._convert_from_mdnov(self.projectName, quick=True),
+                ProjectPath=self.projectPath,
+            )
+        return self._commonMapping
+
     def _get_fileFooter(self):
         """Process the file footer.
         
@@ -298,7 +360,7 @@ class FileExport(File):
         This is a template method that can be extended or overridden by subclasses.
         """
         lines = []
-        template = Template(self._fileFooter)
+        template = self._get_template(self._fileFooter)
         lines.append(template.safe_substitute(self._get_fileFooterMapping()))
         return lines
 
@@ -315,7 +377,7 @@ class FileExport(File):
         This is a template method that can be extended or overridden by subclasses.
         """
         lines = []
-        template = Template(self._fileHeader)
+        template = self._get_template(self._fileHeader)
         lines.append(template.safe_substitute(self._get_fileHeaderMapping()))
         return lines
 
@@ -338,11 +400,11 @@ class FileExport(File):
             message = expFilter.get_message(self)
             if message:
                 filterMessages.append(message)
-            if filterMessages:
-                filters = self._convert_from_mdnov('\n'.join(filterMessages))
-            else:
-                filters = ''
-            pltPrgs, chrczn, wrldbld, goal, cflct, outcm, chrBio, chrGls = self._get_renamings()
+        if filterMessages:
+            filters = self._convert_from_mdnov('\n'.join(filterMessages))
+        else:
+            filters = ''
+        pltPrgs, chrczn, wrldbld, goal, cflct, outcm, chrBio, chrGls = self._get_renamings()
 
         fileHeaderMapping = dict(
             Title=self._convert_from_mdnov(self.novel.title, quick=True),
@@ -368,20 +430,20 @@ class FileExport(File):
         
         This is a template method that can be extended or overridden by subclasses.
         """
-        if self.novel.items[itId].tags is not None:
-            tags = list_to_string(self.novel.items[itId].tags, divider=self._DIVIDER)
+        item = self.novel.items[itId]
+        if item.tags is not None:
+            tags = self._DIVIDER.join(item.tags)
         else:
             tags = ''
 
         itemMapping = dict(
+            self._get_commonMapping(),
             ID=itId,
-            Title=self._convert_from_mdnov(self.novel.items[itId].title, quick=True),
-            Desc=self._convert_from_mdnov(self.novel.items[itId].desc),
-            Notes=self._convert_from_mdnov(self.novel.items[itId].notes),
+            Title=self._convert_from_mdnov(item.title, quick=True),
+            Desc=self._convert_from_mdnov(item.desc),
+            Notes=self._convert_from_mdnov(item.notes),
             Tags=self._convert_from_mdnov(tags, quick=True),
-            AKA=self._convert_from_mdnov(self.novel.items[itId].aka, quick=True),
-            ProjectName=self._convert_from_mdnov(self.projectName, quick=True),
-            ProjectPath=self.projectPath,
+            AKA=self._convert_from_mdnov(item.aka, quick=True),
             ItemsSuffix=ITEMS_SUFFIX,
         )
         return itemMapping
@@ -399,12 +461,31 @@ class FileExport(File):
             lines = [self._itemSectionHeading]
         else:
             lines = []
-        template = Template(self._itemTemplate)
+        template = self._get_template(self._itemTemplate)
         for itId in self.novel.tree.get_children(IT_ROOT):
             if self.itemFilter.accept(self, itId):
                 lines.append(template.safe_substitute(self._get_itemMapping(itId)))
         return lines
 
+    def _get_lines(self):
+        """Call all processing methods.
+        
+        Return a list of strings to be written to the output file.
+        This is a template method that can be extended or overridden by subclasses.
+        """
+        self._renamings = None
+        self._commonMapping = None
+        # the novel's custom labels or the file path may have changed since the last export
+        lines = self._get_fileHeader()
+        lines.extend(self._get_chapters())
+        lines.extend(self._get_characters())
+        lines.extend(self._get_locations())
+        lines.extend(self._get_items())
+        lines.extend(self._get_arcs())
+        lines.extend(self._get_projectNotes())
+        lines.extend(self._get_fileFooter())
+        return lines
+
     def _get_locationMapping(self, lcId):
         """Return a mapping dictionary for a location section.
         
@@ -413,20 +494,20 @@ class FileExport(File):
         
         This is a template method that can be extended or overridden by subclasses.
         """
-        if self.novel.locations[lcId].tags is not None:
-            tags = list_to_string(self.novel.locations[lcId].tags, divider=self._DIVIDER)
+        location = self.novel.locations[lcId]
+        if location.tags is not None:
+            tags = self._DIVIDER.join(location.tags)
         else:
             tags = ''
 
         locationMapping = dict(
+            self._get_commonMapping(),
             ID=lcId,
-            Title=self._convert_from_mdnov(self.novel.locations[lcId].title, quick=True),
-            Desc=self._convert_from_mdnov(self.novel.locations[lcId].desc),
-            Notes=self._convert_from_mdnov(self.novel.locations[lcId].notes),
+            Title=self._convert_from_mdnov(location.title, quick=True),
+            Desc=self._convert_from_mdnov(location.desc),
+            Notes=self._convert_from_mdnov(location.notes),
             Tags=self._convert_from_mdnov(tags, quick=True),
-            AKA=self._convert_from_mdnov(self.novel.locations[lcId].aka, quick=True),
-            ProjectName=self._convert_from_mdnov(self.projectName, quick=True),
-            ProjectPath=self.projectPath,
+            AKA=self._convert_from_mdnov(location.aka, quick=True),
             LocationsSuffix=LOCATIONS_SUFFIX,
         )
         return locationMapping
@@ -444,46 +525,50 @@ class FileExport(File):
             lines = [self._locationSectionHeading]
         else:
             lines = []
-        template = Template(self._locationTemplate)
+        template = self._get_template(self._locationTemplate)
         for lcId in self.novel.tree.get_children(LC_ROOT):
             if self.locationFilter.accept(self, lcId):
                 lines.append(template.safe_substitute(self._get_locationMapping(lcId)))
         return lines
 
     def _get_renamings(self):
+        if self._renamings is not None:
+            return self._renamings
+
         if self.novel.customPlotProgress:
             pltPrgs = self.novel.customPlotProgress
         else:
-            pltPrgs = _('Plot progress')
+            pltPrgs = self._PLOT_PROGRESS
         if self.novel.customCharacterization:
             chrczn = self.novel.customCharacterization
         else:
-            chrczn = _('Characterization')
+            chrczn = self._CHARACTERIZATION
         if self.novel.customWorldBuilding:
             wrldbld = self.novel.customWorldBuilding
         else:
-            wrldbld = _('World building')
+            wrldbld = self._WORLD_BUILDING
         if self.novel.customGoal:
             goal = self.novel.customGoal
         else:
-            goal = _('Opening')
+            goal = self._GOAL
         if self.novel.customConflict:
             cflct = self.novel.customConflict
         else:
-            cflct = _('Peak em. moment')
+            cflct = self._CONFLICT
         if self.novel.customOutcome:
             outcm = self.novel.customOutcome
         else:
-            outcm = _('Ending')
+            outcm = self._OUTCOME
         if self.novel.customChrBio:
             chrBio = self.novel.customChrBio
         else:
-            chrBio = _('Bio')
+            chrBio = self._CHR_BIO
         if self.novel.customChrGoals:
             chrGls = self.novel.customChrGoals
         else:
-            chrGls = _('Goals')
-        return pltPrgs, chrczn, wrldbld, goal, cflct, outcm, chrBio, chrGls
+            chrGls = self._CHR_GOALS
+        self._renamings = pltPrgs, chrczn, wrldbld, goal, cflct, outcm, chrBio, chrGls
+        return self._renamings
 
     def _get_sectionMapping(self, scId, sectionNumber, wordsTotal, firstInChapter=False):
         """Return a mapping dictionary for a section section.
@@ -497,24 +582,25 @@ class FileExport(File):
         
         This is a template method that can be extended or overridden by subclasses.
         """
+        section = self.novel.sections[scId]
 
         #--- Create a comma separated tag list.
         if sectionNumber == 0:
             sectionNumber = ''
-        if self.novel.sections[scId].tags is not None:
-            tags = list_to_string(self.novel.sections[scId].tags, divider=self._DIVIDER)
+        if section.tags is not None:
+            tags = self._DIVIDER.join(section.tags)
         else:
             tags = ''
 
         #--- Create a comma separated character list.
-        if self.novel.sections[scId].characters is not None:
-            sChList = []
-            for crId in self.novel.sections[scId].characters:
-                sChList.append(self.novel.characters[crId].title)
-            sectionChars = list_to_string(sChList, divider=self._DIVIDER)
+        if section.characters is not None:
+            characters = self.novel.characters
+            sChList = [characters[crId].title for crId in section.characters]
+            sectionChars = self._DIVIDER.join([title for title in sChList if title])
+            # skipping untitled characters
 
             if sChList:
-                viewpointChar = sChList[0]
+                viewpointChar = sChList[0] or ''
             else:
                 viewpointChar = ''
         else:
@@ -522,35 +608,37 @@ class FileExport(File):
             viewpointChar = ''
 
         #--- Create a comma separated location list.
-        if self.novel.sections[scId].locations is not None:
-            sLcList = []
-            for lcId in self.novel.sections[scId].locations:
-                sLcList.append(self.novel.locations[lcId].title)
-            sectionLocs = list_to_string(sLcList, divider=self._DIVIDER)
+        if section.locations is not None:
+            locations = self.novel.locations
+            sLcList = [locations[lcId].title for lcId in section.locations]
+            sectionLocs = self._DIVIDER.join([title for title in sLcList if title])
         else:
             sectionLocs = ''
 
         #--- Create a comma separated item list.
-        if self.novel.sections[scId].items is not None:
-            sItList = []
-            for itId in self.novel.sections[scId].items:
-                sItList.append(self.novel.items[itId].title)
-            sectionItems = list_to_string(sItList, divider=self._DIVIDER)
+        if section.items is not None:
+            items = self.novel.items
+            sItList = [items[itId].title for itId in section.items]
+            sectionItems = self._DIVIDER.join([title for title in sItList if title])
         else:
             sectionItems = ''
 
         #--- Date or day.
-        if self.novel.sections[scId].date is not None and self.novel.sections[scId].date != Section.NULL_DATE:
+        if section.date is not None and section.date != Section.NULL_DATE:
             scDay = ''
-            isoDate = self.novel.sections[scId].date
-            cmbDate = self.novel.sections[scId].localeDate
-            yearStr, monthStr, dayStr = isoDate.split('-')
-            dtMonth = MONTHS[int(monthStr) - 1]
+            isoDate = section.date
             try:
-                dtWeekday = WEEKDAYS[self.novel.sections[scId].weekDay]
-            except TypeError:
-                dtWeekday = ''
-            # this is for Timeline conversion
+                cmbDate, yearStr, monthStr, dayStr, dtMonth, dtWeekday = self._dateFields[isoDate]
+            except KeyError:
+                cmbDate = section.localeDate
+                yearStr, monthStr, dayStr = isoDate.split('-')
+                dtMonth = MONTHS[int(monthStr) - 1]
+                try:
+                    dtWeekday = WEEKDAYS[section.weekDay]
+                except TypeError:
+                    dtWeekday = ''
+                # this is for Timeline conversion
+                self._dateFields[isoDate] = cmbDate, yearStr, monthStr, dayStr, dtMonth, dtWeekday
 
         else:
             isoDate = ''
@@ -559,41 +647,45 @@ class FileExport(File):
             dayStr = ''
             dtMonth = ''
             dtWeekday = ''
-            if self.novel.sections[scId].day is not None:
-                scDay = self.novel.sections[scId].day
-                cmbDate = f'{_("Day")} {self.novel.sections[scId].day}'
+            if section.day is not None:
+                scDay = section.day
+                cmbDate = f'{self._DAY} {section.day}'
             else:
                 scDay = ''
                 cmbDate = ''
 
         #--- Time.
-        if self.novel.sections[scId].time is not None:
-            h, m, s = self.novel.sections[scId].time.split(':')
-            scTime = f'{h}:{m}'
-            odsTime = f'PT{h}H{m}M{s}S'
-            # removing seconds
+        if section.time is not None:
+            try:
+                scTime, odsTime = self._timeFields[section.time]
+            except KeyError:
+                h, m, s = section.time.split(':')
+                scTime = f'{h}:{m}'
+                odsTime = f'PT{h}H{m}M{s}S'
+                # removing seconds
+                self._timeFields[section.time] = scTime, odsTime
         else:
             scTime = ''
             odsTime = ''
 
         #--- Create a combined duration information.
-        if self.novel.sections[scId].lastsDays is not None and self.novel.sections[scId].lastsDays != '0':
-            lastsDays = self.novel.sections[scId].lastsDays
-            days = f'{self.novel.sections[scId].lastsDays}d '
+        if section.lastsDays is not None and section.lastsDays != '0':
+            lastsDays = section.lastsDays
+            days = f'{section.lastsDays}d '
         else:
             lastsDays = ''
             days = ''
 
-        if self.novel.sections[scId].lastsHours is not None and self.novel.sections[scId].lastsHours != '0':
-            lastsHours = self.novel.sections[scId].lastsHours
-            hours = f'{self.novel.sections[scId].lastsHours}h '
+        if section.lastsHours is not None and section.lastsHours != '0':
+            lastsHours = section.lastsHours
+            hours = f'{section.lastsHours}h '
         else:
             lastsHours = ''
             hours = ''
 
-        if self.novel.sections[scId].lastsMinutes is not None and self.novel.sections[scId].lastsMinutes != '0':
-            lastsMinutes = self.novel.sections[scId].lastsMinutes
-            minutes = f'{self.novel.sections[scId].lastsMinutes}min'
+        if section.lastsMinutes is not None and section.lastsMinutes != '0':
+            lastsMinutes = section.lastsMinutes
+            minutes = f'{section.lastsMinutes}min'
         else:
             lastsMinutes = ''
             minutes = ''
@@ -602,22 +694,23 @@ class FileExport(File):
 
         pltPrgs, chrczn, wrldbld, goal, cflct, outcm, __, __ = self._get_renamings()
         sectionMapping = dict(
+            self._get_commonMapping(),
             ID=scId,
             SectionNumber=sectionNumber,
             Title=self._convert_from_mdnov(
-                self.novel.sections[scId].title,
+                section.title,
                 quick=True
                 ),
             Desc=self._convert_from_mdnov(
-                self.novel.sections[scId].desc,
-                append=self.novel.sections[scId].appendToPrev
+                section.desc,
+                append=section.appendToPrev
                 ),
-            WordCount=str(self.novel.sections[scId].wordCount),
+            WordCount=str(section.wordCount),
             WordsTotal=wordsTotal,
-            Status=int(self.novel.sections[scId].status),
+            Status=int(section.status),
             SectionContent=self._convert_from_mdnov(
-                        self.novel.sections[scId].sectionContent,
-                        append=self.novel.sections[scId].appendToPrev,
+                        section.sectionContent,
+                        append=section.appendToPrev,
                         firstInChapter=firstInChapter,
                         ),
             Date=isoDate,
@@ -634,18 +727,16 @@ class FileExport(File):
             LastsHours=lastsHours,
             LastsMinutes=lastsMinutes,
             Duration=duration,
-            Scene=Section.SCENE[self.novel.sections[scId].scene],
-            Goal=self._convert_from_mdnov(self.novel.sections[scId].goal),
-            Conflict=self._convert_from_mdnov(self.novel.sections[scId].conflict),
-            Outcome=self._convert_from_mdnov(self.novel.sections[scId].outcome),
+            Scene=Section.SCENE[section.scene],
+            Goal=self._convert_from_mdnov(section.goal),
+            Conflict=self._convert_from_mdnov(section.conflict),
+            Outcome=self._convert_from_mdnov(section.outcome),
             Tags=self._convert_from_mdnov(tags, quick=True),
             Characters=sectionChars,
             Viewpoint=viewpointChar,
             Locations=sectionLocs,
             Items=sectionItems,
-            Notes=self._convert_from_mdnov(self.novel.sections[scId].notes),
-            ProjectName=self._convert_from_mdnov(self.projectName, quick=True),
-            ProjectPath=self.projectPath,
+            Notes=self._convert_from_mdnov(section.notes),
             SectionsSuffix=SECTIONS_SUFFIX,
             CustomPlotProgress=pltPrgs,
             CustomCharacterization=chrczn,
@@ -677,42 +768,42 @@ class FileExport(File):
         """
         lines = []
         firstSectionInChapter = True
+        sections = self.novel.sections
+        isUnusedChapter = self.novel.chapters[chId].chType == 1
         for scId in self.novel.tree.get_children(chId):
             template = None
             dispNumber = 0
             if not self.sectionFilter.accept(self, scId):
                 continue
 
-            sectionContent = self.novel.sections[scId].sectionContent
-            if sectionContent is None:
-                sectionContent = ''
-
-            if self.novel.sections[scId].scType == 2:
+            section = sections[scId]
+            scType = section.scType
+            if scType == 2:
                 if self._stage1Template:
-                    template = Template(self._stage1Template)
+                    template = self._get_template(self._stage1Template)
                 else:
                     continue
 
-            elif self.novel.sections[scId].scType == 3:
+            elif scType == 3:
                 if self._stage2Template:
-                    template = Template(self._stage2Template)
+                    template = self._get_template(self._stage2Template)
                 else:
                     continue
 
-            elif self.novel.sections[scId].scType == 1 or self.novel.chapters[chId].chType == 1:
+            elif scType == 1 or isUnusedChapter:
                 if self._unusedSectionTemplate:
-                    template = Template(self._unusedSectionTemplate)
+                    template = self._get_template(self._unusedSectionTemplate)
                 else:
                     continue
 
             else:
                 sectionNumber += 1
                 dispNumber = sectionNumber
-                wordsTotal += self.novel.sections[scId].wordCount
-                template = Template(self._sectionTemplate)
+                wordsTotal += section.wordCount
+                template = self._get_template(self._sectionTemplate)
                 if firstSectionInChapter and self._firstSectionTemplate:
-                    template = Template(self._firstSectionTemplate)
-            if not (firstSectionInChapter or self.novel.sections[scId].appendToPrev or self.novel.sections[scId].scType > 1):
+                    template = self._get_template(self._firstSectionTemplate)
+            if not (firstSectionInChapter or section.appendToPrev or scType > 1):
                 lines.append(self._sectionDivider)
             if template is not None:
                 lines.append(
@@ -724,7 +815,7 @@ class FileExport(File):
                             )
                         )
                     )
-            if self.novel.sections[scId].scType < 2:
+            if scType < 2:
                 firstSectionInChapter = False
         return lines, sectionNumber, wordsTotal
 
@@ -736,12 +827,12 @@ class FileExport(File):
         
         This is a template method that can be extended or overridden by subclasses.
         """
+        projectNote = self.novel.projectNotes[pnId]
         noteMapping = dict(
+            self._get_commonMapping(),
             ID=pnId,
-            Title=self._convert_from_mdnov(self.novel.projectNotes[pnId].title, quick=True),
-            Desc=self._convert_from_mdnov(self.novel.projectNotes[pnId].desc),
-            ProjectName=self._convert_from_mdnov(self.projectName, quick=True),
-            ProjectPath=self.projectPath,
+            Title=self._convert_from_mdnov(projectNote.title, quick=True),
+            Desc=self._convert_from_mdnov(projectNote.desc),
         )
         return noteMapping
 
@@ -755,25 +846,29 @@ class FileExport(File):
         This is a template method that can be extended or overridden by subclasses.
         """
         lines = []
-        template = Template(self._projectNoteTemplate)
+        template = self._get_template(self._projectNoteTemplate)
         for pnId in self.novel.tree.get_children(PN_ROOT):
             pnMap = self._get_prjNoteMapping(pnId)
             lines.append(template.safe_substitute(pnMap))
         return lines
 
+    def _get_template(self, text):
+        """Return a SafeTemplate instance for text, creating it only once."""
+        try:
+            return self._templates[text]
+
+        except KeyError:
+            template = SafeTemplate(text)
+            self._templates[text] = template
+            return template
+
     def _get_text(self):
-        """Call all processing methods.
-        
-        Return a string to be written to the output file.
-        This is a template method that can be extended or overridden by subclasses.
-        """
-        lines = self._get_fileHeader()
-        lines.extend(self._get_chapters())
-        lines.extend(self._get_characters())
-        lines.extend(self._get_locations())
-        lines.extend(self._get_items())
-        lines.extend(self._get_arcs())
-        lines.extend(self._get_projectNotes())
-        lines.extend(self._get_fileFooter())
-        return ''.join(lines)
+        """Return a string to be written to the output file."""
+        return ''.join(self._get_lines())
 
+    def _remove_file(self, filePath):
+        """Delete a file, if possible."""
+        try:
+            os.remove(filePath)
+        except OSError:
+            pass
@@ -0,0 +1,64 @@
+"""Provide a class for fast placeholder substitution in export templates.
+
+Copyright (c) 2024 Peter Triesberger
+For further information see https://github.com/peter88213/mdnvlib
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+from string import Template
+
+
+class SafeTemplate:
+    """String template with $-placeholders, rendered via str.format_map.
+
+    The template string uses the string.Template syntax.
+    It is scanned only once, when the instance is created,
+    and converted into a format string.
+    Substitution then runs in C instead of calling back into Python per placeholder.
+    """
+    __slots__ = ('_template', '_formatStr', '_placeholders', '_ambiguous')
+
+    def __init__(self, template):
+        """Convert the template into a format string.
+
+        Positional arguments:
+            template: str -- template with string.Template placeholders.
+        """
+        self._template = template
+        parts = []
+        self._placeholders = {}
+        # key: placeholder name, value: placeholder as written in the template
+        self._ambiguous = []
+        # names written both as "$name" and "${name}"
+        position = 0
+        for match in Template.pattern.finditer(template):
+            parts.append(template[position:match.start()].replace('{', '{{').replace('}', '}}'))
+            name = match.group('named') or match.group('braced')
+            if name is not None:
+                parts.append(f'{{{name}}}')
+                placeholder = self._placeholders.setdefault(name, match.group())
+                if placeholder != match.group() and not name in self._ambiguous:
+                    self._ambiguous.append(name)
+            else:
+                parts.append(Template.delimiter)
+                # "$$" or a delimiter that does not start a placeholder
+            position = match.end()
+        parts.append(template[position:].replace('{', '{{').replace('}', '}}'))
+        self._formatStr = ''.join(parts)
+
+    def safe_substitute(self, mapping):
+        """Return the template with the placeholders substituted.
+
+        Positional arguments:
+            mapping -- dictionary with the placeholder values.
+
+        Like string.Template.safe_substitute(),
+        leave placeholders that are missing in mapping unchanged.
+        """
+        for name in self._ambiguous:
+            if not name in mapping:
+                # a single format field cannot restore both spellings
+                return Template(self._template).safe_substitute(mapping)
+
+        values = self._placeholders.copy()
+        values.update(mapping)
+        return self._formatStr.format_map(values)
@@ -7,11 +7,14 @@ License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
 
 
 def sanitize_markdown(text):
-    while '\n---' in text:
-        text = text.replace('\n---', '\n???')
+    if not ('\n' in text or '@@' in text or '%%' in text):
+        # one-liner without markup to be escaped
+        return text.strip()
+
+    text = text.replace('\n---', '\n???')
+    # one pass is enough, because the replacement cannot form a new match
     text = text.replace('@@', '??')
     text = text.replace('%%', '??')
-    while '\n\n' in text:
-        text = text.replace('\n\n', '\n')
-    text = text.replace('\n', '\n\n').strip()
+    text = '\n\n'.join(filter(None, text.split('\n'))).strip()
+    # collapsing runs of line breaks and doubling them in one pass
     return text
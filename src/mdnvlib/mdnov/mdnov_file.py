@@ -33,7 +33,6 @@ from mdnvlib.novx_globals import PRJ_NOTE_PREFIX
 from mdnvlib.novx_globals import SECTION_PREFIX
 from mdnvlib.novx_globals import _
 from mdnvlib.novx_globals import intersection
-from mdnvlib.novx_globals import list_to_string
 
 
 class MdnovFile(MdFile):
@@ -128,6 +127,52 @@ $Links$Desc
 '''
     _fileFooter = '\n$Wordcountlog\n\n%%'
 
+    _CHAPTER_PROPERTIES = {
+        'Desc':Chapter.desc,
+        'Notes':Chapter.notes,
+    }
+    # key: str -- text range tag
+    # value: property -- element class property holding the text
+
+    _CHARACTER_PROPERTIES = {
+        'Desc':Character.desc,
+        'Notes':Character.notes,
+        'Bio':Character.bio,
+        'Goals':Character.goals,
+    }
+
+    _WORLD_ELEMENT_PROPERTIES = {
+        'Desc':WorldElement.desc,
+        'Notes':WorldElement.notes,
+    }
+
+    _PLOT_LINE_PROPERTIES = {
+        'Desc':PlotLine.desc,
+        'Notes':PlotLine.notes,
+    }
+
+    _PLOT_POINT_PROPERTIES = {
+        'Desc':PlotPoint.desc,
+        'Notes':PlotPoint.notes,
+    }
+
+    _PROJECT_PROPERTIES = {
+        'Desc':Novel.desc,
+    }
+
+    _PROJECT_NOTE_PROPERTIES = {
+        'Desc':BasicElement.desc,
+    }
+
+    _SECTION_PROPERTIES = {
+        'Desc':Section.desc,
+        'Notes':Section.notes,
+        'Goal':Section.goal,
+        'Conflict':Section.conflict,
+        'Outcome':Section.outcome,
+        'Content':Section.sectionContent,
+    }
+
     def __init__(self, filePath, **kwargs):
         """Initialize instance variables.
         
@@ -158,15 +203,21 @@ $Links$Desc
 
     def adjust_section_types(self):
         """Make sure that nodes with "Unused" parents inherit the type."""
+        chapters = self.novel.chapters
+        sections = self.novel.sections
+        get_children = self.novel.tree.get_children
         partType = 0
-        for chId in self.novel.tree.get_children(CH_ROOT):
-            if self.novel.chapters[chId].chLevel == 1:
-                partType = self.novel.chapters[chId].chType
-            elif partType != 0 and not self.novel.chapters[chId].isTrash:
-                self.novel.chapters[chId].chType = partType
-            for scId in self.novel.tree.get_children(chId):
-                if self.novel.sections[scId].scType < self.novel.chapters[chId].chType:
-                    self.novel.sections[scId].scType = self.novel.chapters[chId].chType
+        for chId in get_children(CH_ROOT):
+            chapter = chapters[chId]
+            if chapter.chLevel == 1:
+                partType = chapter.chType
+            elif partType != 0 and not chapter.isTrash:
+                chapter.chType = partType
+            chType = chapter.chType
+            for scId in get_children(chId):
+                section = sections[scId]
+                if section.scType < chType:
+                    section.scType = chType
 
     def count_words(self):
         """Return a tuple of word count totals.
@@ -176,13 +227,19 @@ $Links$Desc
         """
         count = 0
         totalCount = 0
-        for chId in self.novel.tree.get_children(CH_ROOT):
-            if not self.novel.chapters[chId].isTrash:
-                for scId in self.novel.tree.get_children(chId):
-                    if self.novel.sections[scId].scType < 2:
-                        totalCount += self.novel.sections[scId].wordCount
-                        if self.novel.sections[scId].scType == 0:
-                            count += self.novel.sections[scId].wordCount
+        chapters = self.novel.chapters
+        sections = self.novel.sections
+        get_children = self.novel.tree.get_children
+        for chId in get_children(CH_ROOT):
+            if not chapters[chId].isTrash:
+                for scId in get_children(chId):
+                    section = sections[scId]
+                    scType = section.scType
+                    if scType < 2:
+                        wordCount = section.wordCount
+                        totalCount += wordCount
+                        if scType == 0:
+                            count += wordCount
         return count, totalCount
 
     def read(self):
@@ -190,118 +247,127 @@ $Links$Desc
         
         Overrides the superclass method.
         """
-        with open(self.filePath, 'r', encoding='utf-8') as f:
-            lines = f.read().split('\n')
         processor = None
         elemId = None
         chId = None
         self._collectedLines = None
         self.novel.tree.reset()
-        for self._line in lines:
-            if self._line.startswith('@@book'):
-                processor = self._read_project
-                elemId = None
-                element = self.novel
-                continue
-
-            if self._line.startswith(f'@@{CHAPTER_PREFIX}'):
-                processor = self._read_chapter
-                elemId = self._line.split('@@')[1].strip()
-                self.novel.chapters[elemId] = Chapter(on_element_change=self.on_element_change)
-                self.novel.tree.append(CH_ROOT, elemId)
-                element = self.novel.chapters[elemId]
-                chId = elemId
-                continue
-
-            if self._line.startswith(f'@@{CHARACTER_PREFIX}'):
-                processor = self._read_character
-                elemId = self._line.split('@@')[1].strip()
-                self.novel.characters[elemId] = Character(on_element_change=self.on_element_change)
-                self.novel.tree.append(CR_ROOT, elemId)
-                element = self.novel.characters[elemId]
-                continue
-
-            if self._line.startswith(f'@@{ITEM_PREFIX}'):
-                processor = self._read_world_element
-                elemId = self._line.split('@@')[1].strip()
-                self.novel.items[elemId] = WorldElement(on_element_change=self.on_element_change)
-                self.novel.tree.append(IT_ROOT, elemId)
-                element = self.novel.items[elemId]
-                continue
-
-            if self._line.startswith(f'@@{LOCATION_PREFIX}'):
-                processor = self._read_world_element
-                elemId = self._line.split('@@')[1].strip()
-                self.novel.locations[elemId] = WorldElement(on_element_change=self.on_element_change)
-                self.novel.tree.append(LC_ROOT, elemId)
-                element = self.novel.locations[elemId]
-                continue
-
-            if self._line.startswith(f'@@{PLOT_LINE_PREFIX}'):
-                processor = self._read_plot_line
-                elemId = self._line.split('@@')[1].strip()
-                self.novel.plotLines[elemId] = PlotLine(on_element_change=self.on_element_change)
-                self.novel.tree.append(PL_ROOT, elemId)
-                element = self.novel.plotLines[elemId]
-                plId = elemId
-                continue
-
-            if self._line.startswith(f'@@{PLOT_POINT_PREFIX}'):
-                processor = self._read_plot_point
-                elemId = self._line.split('@@')[1].strip()
-                self.novel.plotPoints[elemId] = PlotPoint(on_element_change=self.on_element_change)
-                self.novel.tree.append(plId, elemId)
-                element = (self.novel.plotPoints[elemId])
-                continue
-
-            if self._line.startswith(f'@@{PRJ_NOTE_PREFIX}'):
-                processor = self._read_project_note
-                elemId = self._line.split('@@')[1].strip()
-                self.novel.projectNotes[elemId] = BasicElement()
-                self.novel.tree.append(PN_ROOT, elemId)
-                element = self.novel.projectNotes[elemId]
-                continue
-
-            if self._line.startswith(f'@@{SECTION_PREFIX}'):
-                processor = self._read_section
-                elemId = self._line.split('@@')[1].strip()
-                self.novel.sections[elemId] = Section(on_element_change=self.on_element_change)
-                self.novel.tree.append(chId, elemId)
-                element = self.novel.sections[elemId]
-                continue
-
-            if self._line.startswith(f'@@Progress'):
-                processor = self._read_word_count_log
-                elemId = None
-                continue
-
-            if processor is not None:
-                processor(element)
-
-        for scId in self.novel.sections:
+        with open(self.filePath, 'r', encoding='utf-8', buffering=self._BUFFER_SIZE) as f:
+            for line in f:
+                self._line = line.rstrip('\n')
+                if self._line.startswith('@@'):
+                    # Element marker: dispatch on the ID prefix.
+                    prefix = self._line[2:4]
+                    if self._line.startswith('@@book'):
+                        processor = self._read_project
+                        elemId = None
+                        element = self.novel
+                        continue
+
+                    if prefix == CHAPTER_PREFIX:
+                        processor = self._read_chapter
+                        elemId = self._line[2:].strip()
+                        self.novel.chapters[elemId] = Chapter(on_element_change=self.on_element_change)
+                        self.novel.tree.append(CH_ROOT, elemId)
+                        element = self.novel.chapters[elemId]
+                        chId = elemId
+                        continue
+
+                    if prefix == CHARACTER_PREFIX:
+                        processor = self._read_character
+                        elemId = self._line[2:].strip()
+                        self.novel.characters[elemId] = Character(on_element_change=self.on_element_change)
+                        self.novel.tree.append(CR_ROOT, elemId)
+                        element = self.novel.characters[elemId]
+                        continue
+
+                    if prefix == ITEM_PREFIX:
+                        processor = self._read_world_element
+                        elemId = self._line[2:].strip()
+                        self.novel.items[elemId] = WorldElement(on_element_change=self.on_element_change)
+                        self.novel.tree.append(IT_ROOT, elemId)
+                        element = self.novel.items[elemId]
+                        continue
+
+                    if prefix == LOCATION_PREFIX:
+                        processor = self._read_world_element
+                        elemId = self._line[2:].strip()
+                        self.novel.locations[elemId] = WorldElement(on_element_change=self.on_element_change)
+                        self.novel.tree.append(LC_ROOT, elemId)
+                        element = self.novel.locations[elemId]
+                        continue
+
+                    if prefix == PLOT_LINE_PREFIX:
+                        processor = self._read_plot_line
+                        elemId = self._line[2:].strip()
+                        self.novel.plotLines[elemId] = PlotLine(on_element_change=self.on_element_change)
+                        self.novel.tree.append(PL_ROOT, elemId)
+                        element = self.novel.plotLines[elemId]
+                        plId = elemId
+                        continue
+
+                    if prefix == PLOT_POINT_PREFIX:
+                        processor = self._read_plot_point
+                        elemId = self._line[2:].strip()
+                        self.novel.plotPoints[elemId] = PlotPoint(on_element_change=self.on_element_change)
+                        self.novel.tree.append(plId, elemId)
+                        element = (self.novel.plotPoints[elemId])
+                        continue
+
+                    if prefix == PRJ_NOTE_PREFIX:
+                        processor = self._read_project_note
+                        elemId = self._line[2:].strip()
+                        self.novel.projectNotes[elemId] = BasicElement()
+                        self.novel.tree.append(PN_ROOT, elemId)
+                        element = self.novel.projectNotes[elemId]
+                        continue
+
+                    if prefix == SECTION_PREFIX:
+                        processor = self._read_section
+                        elemId = self._line[2:].strip()
+                        self.novel.sections[elemId] = Section(on_element_change=self.on_element_change)
+                        self.novel.tree.append(chId, elemId)
+                        element = self.novel.sections[elemId]
+                        continue
+
+                    if self._line.startswith('@@Progress'):
+                        processor = self._read_word_count_log
+                        elemId = None
+                        continue
+
+                if processor is not None:
+                    processor(element)
+
+        sections = self.novel.sections
+        characters = self.novel.characters
+        locations = self.novel.locations
+        items = self.novel.items
+        for section in sections.values():
 
             # Remove dead references.
-            self.novel.sections[scId].characters = intersection(self.novel.sections[scId].characters, self.novel.characters)
-            self.novel.sections[scId].locations = intersection(self.novel.sections[scId].locations, self.novel.locations)
-            self.novel.sections[scId].items = intersection(self.novel.sections[scId].items, self.novel.items)
+            section.characters = intersection(section.characters, characters)
+            section.locations = intersection(section.locations, locations)
+            section.items = intersection(section.items, items)
 
-        for ppId in self.novel.plotPoints:
-
-            # Verify section and create back reference.
-            scId = self.novel.plotPoints[ppId].sectionAssoc
-            if scId in self.novel.sections:
-                self.novel.sections[scId].scPlotPoints[ppId] = plId
-            else:
-                self.novel.plotPoints[ppId].sectionAssoc = None
-
-        for plId in self.novel.plotLines:
+        plotPoints = self.novel.plotPoints
+        for plId, plotLine in self.novel.plotLines.items():
 
             # Remove dead references.
-            self.novel.plotLines[plId].sections = intersection(self.novel.plotLines[plId].sections, self.novel.sections)
+            plotLine.sections = intersection(plotLine.sections, sections)
 
             # Create back references.
-            for scId in self.novel.plotLines[plId].sections:
-                self.novel.sections[scId].scPlotLines.append(plId)
+            for scId in plotLine.sections:
+                sections[scId].scPlotLines.append(plId)
+
+            for ppId in self.novel.tree.get_children(plId):
+
+                # Verify section and create back reference.
+                plotPoint = plotPoints[ppId]
+                scId = plotPoint.sectionAssoc
+                if scId in sections:
+                    sections[scId].scPlotPoints[ppId] = plId
+                else:
+                    plotPoint.sectionAssoc = None
 
         self._get_timestamp()
         self._keep_word_count()
@@ -322,32 +388,28 @@ $Links$Desc
         return f'%%{key}:\n\n{sanitize_markdown(text)}\n\n'
 
     def _add_links(self, element, mapping):
-        links = element.get_links()
+        if not element.links:
+            mapping['Links'] = '\n'
+            return mapping
+
         linkRepr = []
-        if links:
-            for relativeLink, absoluteLink in links:
-                linkRepr.append('%%Link:')
-                linkRepr.append(relativeLink)
-                linkRepr.append(absoluteLink)
+        for relativeLink, absoluteLink in element.get_links():
+            linkRepr.extend(('%%Link:', relativeLink, absoluteLink))
         links = '\n\n'.join(linkRepr)
         mapping['Links'] = f'{links}\n'
         return mapping
 
     def _add_plotline_notes(self, prjScn, mapping):
-        plRepr = []
-        if prjScn.plotlineNotes:
-            for plId in prjScn.plotlineNotes:
-                if not plId in prjScn.scPlotLines:
-                    continue
-
-                if not prjScn.plotlineNotes[plId]:
-                    continue
-
-                plRepr.append('%%Plotline:')
-                plRepr.append(plId)
+        plotlineNotes = prjScn.plotlineNotes
+        if not plotlineNotes:
+            mapping['Plotlines'] = '\n\n'
+            return mapping
 
-                plRepr.append('%%Plotline note:')
-                plRepr.append(sanitize_markdown(prjScn.plotlineNotes[plId]))
+        plRepr = []
+        scPlotLines = prjScn.scPlotLines
+        for plId, plNote in plotlineNotes.items():
+            if plNote and plId in scPlotLines:
+                plRepr.extend(('%%Plotline:', plId, '%%Plotline note:', sanitize_markdown(plNote)))
         plStr = '\n\n'.join(plRepr)
         mapping['Plotlines'] = f'{plStr}\n\n'
         return mapping
@@ -358,16 +420,16 @@ $Links$Desc
         return mapping
 
     def _get_arcMapping(self, plId):
-        mapping = super()._get_arcMapping(plId)
         element = self.novel.plotLines[plId]
+        mapping = dict(self._get_commonMapping(), ID=plId)
         mapping = self._add_yaml(element, mapping)
         mapping = self._add_links(element, mapping)
         mapping['Desc'] = self._add_key(element.desc, 'Desc')
         return mapping
 
     def _get_chapterMapping(self, chId, chapterNumber):
-        mapping = super()._get_chapterMapping(chId, chapterNumber)
         element = self.novel.chapters[chId]
+        mapping = dict(self._get_commonMapping(), ID=chId)
         mapping = self._add_yaml(element, mapping)
         mapping = self._add_links(element, mapping)
         mapping['Desc'] = self._add_key(element.desc, 'Desc')
@@ -375,8 +437,8 @@ $Links$Desc
         return mapping
 
     def _get_characterMapping(self, crId):
-        mapping = super()._get_characterMapping(crId)
         element = self.novel.characters[crId]
+        mapping = dict(self._get_commonMapping(), ID=crId)
         mapping = self._add_yaml(element, mapping)
         mapping = self._add_links(element, mapping)
         mapping['Desc'] = self._add_key(element.desc, 'Desc')
@@ -392,17 +454,19 @@ $Links$Desc
             return mapping
 
         lines = ['@@Progress']
+        append = lines.append
+        saveWordCount = self.novel.saveWordCount
         wcLastCount = None
         wcLastTotalCount = None
-        for wc in self.wcLog:
-            if self.novel.saveWordCount:
+        for wc, (wcCount, wcTotalCount) in self.wcLog.items():
+            if saveWordCount:
                 # Discard entries with unchanged word count.
-                if self.wcLog[wc][0] == wcLastCount and self.wcLog[wc][1] == wcLastTotalCount:
+                if wcCount == wcLastCount and wcTotalCount == wcLastTotalCount:
                     continue
 
-                wcLastCount = self.wcLog[wc][0]
-                wcLastTotalCount = self.wcLog[wc][1]
-            lines.append(f'- {list_to_string([wc, self.wcLog[wc][0], self.wcLog[wc][1]])}')
+                wcLastCount = wcCount
+                wcLastTotalCount = wcTotalCount
+            append(f'- {wc};{wcCount};{wcTotalCount}')
         mapping['Wordcountlog'] = '\n'.join(lines)
         return mapping
 
@@ -415,8 +479,8 @@ $Links$Desc
         return mapping
 
     def _get_itemMapping(self, itId):
-        mapping = super()._get_itemMapping(itId)
         element = self.novel.items[itId]
+        mapping = dict(self._get_commonMapping(), ID=itId)
         mapping = self._add_yaml(element, mapping)
         mapping = self._add_links(element, mapping)
         mapping['Desc'] = self._add_key(element.desc, 'Desc')
@@ -424,8 +488,8 @@ $Links$Desc
         return mapping
 
     def _get_locationMapping(self, lcId):
-        mapping = super()._get_locationMapping(lcId)
         element = self.novel.locations[lcId]
+        mapping = dict(self._get_commonMapping(), ID=lcId)
         mapping = self._add_yaml(element, mapping)
         mapping = self._add_links(element, mapping)
         mapping['Desc'] = self._add_key(element.desc, 'Desc')
@@ -433,16 +497,18 @@ $Links$Desc
         return mapping
 
     def _get_prjNoteMapping(self, pnId):
-        mapping = super()._get_prjNoteMapping(pnId)
         element = self.novel.projectNotes[pnId]
+        mapping = dict(self._get_commonMapping(), ID=pnId)
         mapping = self._add_yaml(element, mapping)
         mapping = self._add_links(element, mapping)
         mapping['Desc'] = self._add_key(element.desc, 'Desc')
         return mapping
 
     def _get_sectionMapping(self, scId, sectionNumber, wordsTotal, firstInChapter=False):
-        mapping = super()._get_sectionMapping(scId, sectionNumber, wordsTotal)
         element = self.novel.sections[scId]
+        mapping = dict(self._get_commonMapping(), ID=scId)
+        # The mdnov templates only use the fields set here,
+        # so the generic mapping with its text conversions is not needed.
         mapping = self._add_yaml(element, mapping)
         mapping = self._add_links(element, mapping)
         mapping = self._add_plotline_notes(element, mapping)
@@ -456,9 +522,10 @@ $Links$Desc
 
     def _get_timestamp(self):
         try:
-            self.timestamp = os.path.getmtime(self.filePath)
-        except:
+            self.timestamp = os.stat(self.filePath).st_mtime
+        except (OSError, TypeError):
             self.timestamp = None
+            # file missing, or no valid file path set
 
     def _keep_word_count(self):
         """Keep the actual wordcount, if not logged."""
@@ -500,7 +567,7 @@ $Links$Desc
                 elif self._range == 'Plotline':
                     self._plId = text
                 elif self._range == 'Plotline note'and self._plId is not None:
-                    plNotes = element.plotlineNotes
+                    plNotes = dict(element.plotlineNotes)
                     plNotes[self._plId] = text
                     element.plotlineNotes = plNotes
                     self._plId = None
@@ -517,65 +584,37 @@ $Links$Desc
             self._collectedLines.append(self._line)
 
     def _read_chapter(self, element):
-        self._properties = {
-            'Desc':Chapter.desc,
-            'Notes':Chapter.notes,
-        }
+        self._properties = self._CHAPTER_PROPERTIES
         self._read_element(element)
 
     def _read_character(self, element):
-        self._properties = {
-            'Desc':Character.desc,
-            'Notes':Character.notes,
-            'Bio':Character.bio,
-            'Goals':Character.goals,
-        }
+        self._properties = self._CHARACTER_PROPERTIES
         self._read_element(element)
 
     def _read_world_element(self, element):
-        self._properties = {
-            'Desc':WorldElement.desc,
-            'Notes':WorldElement.notes,
-        }
+        self._properties = self._WORLD_ELEMENT_PROPERTIES
         self._read_element(element)
 
     def _read_plot_line(self, element):
-        self._properties = {
-            'Desc':PlotLine.desc,
-            'Notes':PlotLine.notes,
-        }
+        self._properties = self._PLOT_LINE_PROPERTIES
         self._read_element(element)
 
     def _read_plot_point(self, element):
-        self._properties = {
-            'Desc':PlotPoint.desc,
-            'Notes':PlotPoint.notes,
-        }
+        self._properties = self._PLOT_POINT_PROPERTIES
         self._read_element(element)
 
     def _read_project(self, element):
-        self._properties = {
-            'Desc':Novel.desc,
-        }
+        self._properties = self._PROJECT_PROPERTIES
         self._read_element(element)
 
     def _read_project_note(self, element):
-        self._properties = {
-            'Desc':BasicElement.desc,
-        }
+        self._properties = self._PROJECT_NOTE_PROPERTIES
         self._read_element(element)
 
     def _read_section(self, element):
         if element.plotlineNotes is None:
             element.plotlineNotes = {}
-        self._properties = {
-            'Desc':Section.desc,
-            'Notes':Section.notes,
-            'Goal':Section.goal,
-            'Conflict':Section.conflict,
-            'Outcome':Section.outcome,
-            'Content':Section.sectionContent,
-        }
+        self._properties = self._SECTION_PROPERTIES
         self._read_element(element)
 
     def _read_word_count_log(self, element):
@@ -4,9 +4,49 @@ Copyright (c) 2024 Peter Triesberger
 For further information see https://github.com/peter88213/mdnvlib
 License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
 """
+from operator import attrgetter
+import sys
+from types import MappingProxyType
 from urllib.parse import quote
 from urllib.parse import unquote
 
+from mdnvlib.novx_globals import string_to_list
+
+
+def tracked_property(name, valueType):
+    """Return a property for a change-tracked element attribute.
+    
+    Positional arguments:
+        name: str -- name of the instance variable holding the value.
+        valueType -- type of the value, if not None.
+        
+    The setter calls the element's on_element_change method 
+    if the value changes. The type check is skipped in an optimized build.
+    """
+
+    def set_value(self, newVal):
+        assert newVal is None or type(newVal) is valueType
+        if getattr(self, name) != newVal:
+            setattr(self, name, newVal)
+            self.on_element_change()
+
+    return property(attrgetter(name), set_value)
+
+
+def all_strings(values):
+    """Return True if all values are strings or None."""
+    return all(value is None or type(value) is str for value in values)
+
+
+def get_id_tuple(text):
+    """Return a tuple of the IDs in a YAML reference string."""
+    return tuple(string_to_list(text))
+
+
+def get_yaml_flag(value):
+    """Return True if a YAML flag is set."""
+    return value == '1'
+
 
 class BasicElement:
     """Basic data model element representation.
@@ -17,6 +57,19 @@ class BasicElement:
     The on_element_change method is called when the value of any property changes.
     This method can be overridden at runtime for each individual element instance.
     """
+    __slots__ = (
+        'on_element_change',
+        '_title',
+        '_desc',
+        '_links',
+        '_linksView',
+        '_metaDict',
+        )
+
+    _YAML_FIELDS = ()
+    # (YAML key, instance variable name, parser function) tuples
+    # for loading YAML metadata via _load_yaml_fast();
+    # parser function None means: take the string as it is.
 
     def __init__(self,
             on_element_change=None,
@@ -40,51 +93,28 @@ class BasicElement:
         self._title = title
         self._desc = desc
         if links is None:
-            self._links = {}
-        else:
-            self._links = links
+            links = {}
+        self._links = links
+        self._linksView = MappingProxyType(links)
 
-    @property
-    def title(self):
-        return self._title
-
-    @title.setter
-    def title(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == str
-        if self._title != newVal:
-            self._title = newVal
-            self.on_element_change()
-
-    @property
-    def desc(self):
-        return self._desc
-
-    @desc.setter
-    def desc(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == str
-        if self._desc != newVal:
-            self._desc = newVal
-            self.on_element_change()
+    title = tracked_property('_title', str)
+    desc = tracked_property('_desc', str)
 
     @property
     def links(self):
         # dict: (Key:str -- relative path, value:str -- full path)
-        try:
-            return self._links.copy()
-        except AttributeError:
-            return None
+        # Return a read-only view; for changes, assign a new dict.
+        return self._linksView
 
     @links.setter
     def links(self, newVal):
-        if newVal is not None:
-            for elem in newVal:
-                val = newVal[elem]
-                if val is not None:
-                    assert type(val) == str
+        assert newVal is None or all_strings(newVal.values())
         if self._links != newVal:
             self._links = newVal
+            if newVal is None:
+                self._linksView = None
+            else:
+                self._linksView = MappingProxyType(newVal)
             self.on_element_change()
 
     def do_nothing(self):
@@ -94,15 +124,11 @@ class BasicElement:
     def from_yaml(self, yaml):
         self._metaDict = {}
         for entry in yaml:
-            try:
-                metaData = entry.split(':', maxsplit=1)
-                metaKey = metaData[0].strip()
-                metaValue = metaData[1].strip()
-                self._metaDict[metaKey] = metaValue
-            except:
-                pass
+            metaKey, separator, metaValue = entry.partition(':')
+            if separator:
+                self._metaDict[sys.intern(metaKey.strip())] = metaValue.strip()
 
-        self.title = self._get_meta_value('Title')
+        self.title = self._metaDict.get('Title', None)
 
     def get_links(self):
         """Return a list of (relative link, absolute link) tuples."""
@@ -118,7 +144,7 @@ class BasicElement:
         return linkList
 
     def set_links(self, linkList):
-        links = self.links
+        links = dict(self._links)
         for relativeLink, absoluteLink in linkList:
             links[unquote(relativeLink)] = unquote(absoluteLink).split('file:///')[1]
         self.links = links
@@ -128,10 +154,28 @@ class BasicElement:
             yaml.append(f'Title: {self.title}')
         return yaml
 
+    def _load_yaml_fast(self, metaDict):
+        """Set the instance variables listed in _YAML_FIELDS from metaDict.
+        
+        Positional arguments:
+            metaDict: dict -- YAML metadata (key: str, value: str).
+        
+        Bypass the property setters, so the type checks are skipped;
+        the parser functions are responsible for the value types.
+        Call on_element_change only once, and only if a value has changed.
+        """
+        changed = False
+        for key, name, parse in self._YAML_FIELDS:
+            newVal = metaDict.get(key, None)
+            if parse is not None:
+                newVal = parse(newVal)
+            if getattr(self, name) != newVal:
+                setattr(self, name, newVal)
+                changed = True
+        if changed:
+            self.on_element_change()
+
     def _get_meta_value(self, key, default=None):
-        text = self._metaDict.get(key, None)
-        if text is not None:
-            return text
-        else:
-            return default
+        # the dictionary holds no None values
+        return self._metaDict.get(key, default)
 
@@ -5,10 +5,12 @@ For further information see https://github.com/peter88213/mdnvlib
 License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
 """
 from mdnvlib.model.basic_element import BasicElement
+from mdnvlib.model.basic_element import tracked_property
 
 
 class BasicElementNotes(BasicElement):
     """Basic element with notes."""
+    __slots__ = ('_notes',)
 
     def __init__(self,
             notes=None,
@@ -17,15 +19,5 @@ class BasicElementNotes(BasicElement):
         super().__init__(**kwargs)
         self._notes = notes
 
-    @property
-    def notes(self):
-        return self._notes
-
-    @notes.setter
-    def notes(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == str
-        if self._notes != newVal:
-            self._notes = newVal
-            self.on_element_change()
+    notes = tracked_property('_notes', str)
 
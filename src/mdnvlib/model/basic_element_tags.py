@@ -4,6 +4,7 @@ Copyright (c) 2024 Peter Triesberger
 For further information see https://github.com/peter88213/mdnvlib
 License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
 """
+from mdnvlib.model.basic_element import all_strings
 from mdnvlib.model.basic_element_notes import BasicElementNotes
 from mdnvlib.novx_globals import list_to_string
 from mdnvlib.novx_globals import string_to_list
@@ -11,6 +12,7 @@ from mdnvlib.novx_globals import string_to_list
 
 class BasicElementTags(BasicElementNotes):
     """Basic element with notes and tags."""
+    __slots__ = ('_tags',)
 
     def __init__(self,
             tags=None,
@@ -26,21 +28,15 @@ class BasicElementTags(BasicElementNotes):
 
     @tags.setter
     def tags(self, newVal):
-        if newVal is not None:
-            for elem in newVal:
-                if elem is not None:
-                    assert type(elem) == str
+        assert newVal is None or all_strings(newVal)
         if self._tags != newVal:
             self._tags = newVal
             self.on_element_change()
 
     def from_yaml(self, yaml):
         super().from_yaml(yaml)
-        tags = string_to_list(self._get_meta_value('Tags'))
-        strippedTags = []
-        for tag in tags:
-            strippedTags.append(tag.strip())
-        self.tags = strippedTags
+        self.tags = string_to_list(self._metaDict.get('Tags', None))
+        # string_to_list() strips the tags
 
     def to_yaml(self, yaml):
         yaml = super().to_yaml(yaml)
@@ -4,11 +4,43 @@ Copyright (c) 2024 Peter Triesberger
 For further information see https://github.com/peter88213/mdnvlib
 License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
 """
+from mdnvlib.model.basic_element import get_yaml_flag
+from mdnvlib.model.basic_element import tracked_property
 from mdnvlib.model.basic_element_notes import BasicElementNotes
 
 
+def _get_chapter_type(typeStr):
+    """Return the chType value for a YAML type string."""
+    if typeStr is None or typeStr == '0':
+        return 0
+
+    # "Unused", also for unknown types
+    return 1
+
+
+def _get_chapter_level(levelStr):
+    """Return the chLevel value for a YAML level string."""
+    if levelStr == '1':
+        return 1
+
+    return 2
+
+
 class Chapter(BasicElementNotes):
     """mdnovel chapter representation."""
+    __slots__ = (
+        '_chLevel',
+        '_chType',
+        '_noNumber',
+        '_isTrash',
+        )
+
+    _YAML_FIELDS = (
+        ('type', '_chType', _get_chapter_type),
+        ('level', '_chLevel', _get_chapter_level),
+        ('isTrash', '_isTrash', get_yaml_flag),
+        ('noNumber', '_noNumber', get_yaml_flag),
+    )
 
     def __init__(self,
             chLevel=None,
@@ -23,85 +55,32 @@ class Chapter(BasicElementNotes):
         self._noNumber = noNumber
         self._isTrash = isTrash
 
-    @property
-    def chLevel(self):
-        # 1 = Part level.
-        # 2 = Regular chapter level.
-        return self._chLevel
-
-    @chLevel.setter
-    def chLevel(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == int
-        if self._chLevel != newVal:
-            self._chLevel = newVal
-            self.on_element_change()
-
-    @property
-    def chType(self):
-        # 0 = Normal.
-        # 1 = Unused.
-        return self._chType
-
-    @chType.setter
-    def chType(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == int
-        if self._chType != newVal:
-            self._chType = newVal
-            self.on_element_change()
-
-    @property
-    def noNumber(self):
-        # True: Exclude this chapter from auto-numbering.
-        # False: Auto-number this chapter, if applicable.
-        return self._noNumber
-
-    @noNumber.setter
-    def noNumber(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == bool
-        if self._noNumber != newVal:
-            self._noNumber = newVal
-            self.on_element_change()
-
-    @property
-    def isTrash(self):
-        # True: This chapter is the mdnovel project's "trash bin"
-        # False: This is a chapter or part.
-        return self._isTrash
-
-    @isTrash.setter
-    def isTrash(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == bool
-        if self._isTrash != newVal:
-            self._isTrash = newVal
-            self.on_element_change()
+    chLevel = tracked_property('_chLevel', int)
+    # 1 = Part level.
+    # 2 = Regular chapter level.
+
+    chType = tracked_property('_chType', int)
+    # 0 = Normal.
+    # 1 = Unused.
+
+    noNumber = tracked_property('_noNumber', bool)
+    # True: Exclude this chapter from auto-numbering.
+    # False: Auto-number this chapter, if applicable.
+
+    isTrash = tracked_property('_isTrash', bool)
+    # True: This chapter is the mdnovel project's "trash bin"
+    # False: This is a chapter or part.
 
     def from_yaml(self, yaml):
         super().from_yaml(yaml)
-        typeStr = self._get_meta_value('type', '0')
-        if typeStr in ('0', '1'):
-            self.chType = int(typeStr)
-        else:
-            self.chType = 1
-        chLevel = self._get_meta_value('level', None)
-        if chLevel == '1':
-            self.chLevel = 1
-        else:
-            self.chLevel = 2
-        self.isTrash = self._get_meta_value('isTrash', None) == '1'
-        self.noNumber = self._get_meta_value('noNumber', None) == '1'
+        self._load_yaml_fast(self._metaDict)
 
     def to_yaml(self, yaml):
         yaml = super().to_yaml(yaml)
-        if self.chType:
-            yaml.append(f'type: {self.chType}')
-        if self.chLevel == 1:
-            yaml.append(f'level: 1')
-        if self.isTrash:
-            yaml.append(f'isTrash: 1')
-        if self.noNumber:
-            yaml.append(f'noNumber: 1')
+        yaml.extend(filter(None, (
+            f'type: {self._chType}' if self._chType else None,
+            'level: 1' if self._chLevel == 1 else None,
+            'isTrash: 1' if self._isTrash else None,
+            'noNumber: 1' if self._noNumber else None,
+        )))
         return yaml
@@ -4,6 +4,7 @@ Copyright (c) 2024 Peter Triesberger
 For further information see https://github.com/peter88213/mdnvlib
 License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
 """
+from mdnvlib.model.basic_element import tracked_property
 from mdnvlib.model.world_element import WorldElement
 from mdnvlib.novx_globals import _
 from mdnvlib.novx_globals import verified_date
@@ -11,6 +12,15 @@ from mdnvlib.novx_globals import verified_date
 
 class Character(WorldElement):
     """mdnovel character representation."""
+    __slots__ = (
+        '_bio',
+        '_goals',
+        '_fullName',
+        '_isMajor',
+        '_birthDate',
+        '_deathDate',
+        )
+
     MAJOR_MARKER = _('Major Character')
     MINOR_MARKER = _('Minor Character')
 
@@ -31,96 +41,32 @@ class Character(WorldElement):
         self._birthDate = birthDate
         self._deathDate = deathDate
 
-    @property
-    def bio(self):
-        return self._bio
-
-    @bio.setter
-    def bio(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == str
-        if self._bio != newVal:
-            self._bio = newVal
-            self.on_element_change()
-
-    @property
-    def goals(self):
-        return self._goals
-
-    @goals.setter
-    def goals(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == str
-        if self._goals != newVal:
-            self._goals = newVal
-            self.on_element_change()
-
-    @property
-    def fullName(self):
-        return self._fullName
-
-    @fullName.setter
-    def fullName(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == str
-        if self._fullName != newVal:
-            self._fullName = newVal
-            self.on_element_change()
-
-    @property
-    def isMajor(self):
-        # True: Major character.
-        # False: Minor character.
-        return self._isMajor
-
-    @isMajor.setter
-    def isMajor(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == bool
-        if self._isMajor != newVal:
-            self._isMajor = newVal
-            self.on_element_change()
-
-    @property
-    def birthDate(self):
-        return self._birthDate
-
-    @birthDate.setter
-    def birthDate(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == str
-        if self._birthDate != newVal:
-            self._birthDate = newVal
-            self.on_element_change()
+    bio = tracked_property('_bio', str)
+    goals = tracked_property('_goals', str)
+    fullName = tracked_property('_fullName', str)
 
-    @property
-    def deathDate(self):
-        return self._deathDate
+    isMajor = tracked_property('_isMajor', bool)
+    # True: Major character.
+    # False: Minor character.
 
-    @deathDate.setter
-    def deathDate(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == str
-        if self._deathDate != newVal:
-            self._deathDate = newVal
-            self.on_element_change()
+    birthDate = tracked_property('_birthDate', str)
+    deathDate = tracked_property('_deathDate', str)
 
     def from_yaml(self, yaml):
         super().from_yaml(yaml)
-        self.isMajor = self._get_meta_value('major', None) == '1'
-        self.fullName = self._get_meta_value('FullName')
-        self.birthDate = verified_date(self._get_meta_value('BirthDate'))
-        self.deathDate = verified_date(self._get_meta_value('DeathDate'))
+        metaDict = self._metaDict
+        self.isMajor = metaDict.get('major', None) == '1'
+        self.fullName = metaDict.get('FullName', None)
+        self.birthDate = verified_date(metaDict.get('BirthDate', None))
+        self.deathDate = verified_date(metaDict.get('DeathDate', None))
 
     def to_yaml(self, yaml):
         yaml = super().to_yaml(yaml)
-        if self.isMajor:
-            yaml.append(f'major: 1')
-        if self.fullName:
-            yaml.append(f'FullName: {self.fullName}')
-        if self.birthDate:
-            yaml.append(f'BirthDate: {self.birthDate}')
-        if self.deathDate:
-            yaml.append(f'DeathDate: {self.deathDate}')
+        yaml.extend(filter(None, (
+            'major: 1' if self._isMajor else None,
+            f'FullName: {self._fullName}' if self._fullName else None,
+            f'BirthDate: {self._birthDate}' if self._birthDate else None,
+            f'DeathDate: {self._deathDate}' if self._deathDate else None,
+        )))
         return yaml
 
@@ -9,6 +9,8 @@ from datetime import date
 from datetime import datetime
 from datetime import timedelta
 
+from mdnvlib.novx_globals import parse_iso_date
+
 
 def difference_in_years(startDate, endDate):
     """Return the total number of years between startDate and endDate.
@@ -57,7 +59,7 @@ def get_specific_date(dayStr, refIso):
         refIso:str -- Reference date/time, formatted acc. to ISO 8601
     """
     # Calculate the section date from day and reference date.
-    refDate = date.fromisoformat(refIso)
+    refDate = parse_iso_date(refIso)
     return date.isoformat(refDate + timedelta(days=int(dayStr)))
 
 
@@ -69,6 +71,6 @@ def get_unspecific_date(dateIso, refIso):
         refIso:str -- Reference date/time, formatted acc. to ISO 8601
     """
     # Calculate the section day from date and reference date.
-    refDate = date.fromisoformat(refIso)
-    return str((date.fromisoformat(dateIso) - refDate).days)
+    refDate = parse_iso_date(refIso)
+    return str((parse_iso_date(dateIso) - refDate).days)
 
@@ -4,15 +4,100 @@ Copyright (c) 2024 Peter Triesberger
 For further information see https://github.com/peter88213/mdnvlib
 License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
 """
-from datetime import date
 import locale
 
 from mdnvlib.model.basic_element import BasicElement
+from mdnvlib.model.basic_element import get_yaml_flag
+from mdnvlib.model.basic_element import tracked_property
+from mdnvlib.novx_globals import parse_iso_date
 from mdnvlib.novx_globals import verified_date
 
 
+def _get_work_phase(workPhase):
+    """Return the workPhase value for a YAML work phase string."""
+    if workPhase in ('1', '2', '3', '4', '5'):
+        return int(workPhase)
+
+    return None
+
+
+def _get_heading_affix(affix):
+    """Return a heading prefix or suffix without the enclosing quotes."""
+    if affix:
+        return affix[1:-1]
+
+    return affix
+
+
 class Novel(BasicElement):
     """Novel representation."""
+    __slots__ = (
+        '_authorName',
+        '_wordTarget',
+        '_wordCountStart',
+        '_renumberChapters',
+        '_renumberParts',
+        '_renumberWithinParts',
+        '_romanChapterNumbers',
+        '_romanPartNumbers',
+        '_saveWordCount',
+        '_workPhase',
+        '_chapterHeadingPrefix',
+        '_chapterHeadingSuffix',
+        '_partHeadingPrefix',
+        '_partHeadingSuffix',
+        '_customPlotProgress',
+        '_customCharacterization',
+        '_customWorldBuilding',
+        '_customGoal',
+        '_customConflict',
+        '_customOutcome',
+        '_customChrBio',
+        '_customChrGoals',
+        'chapters',
+        'sections',
+        'plotPoints',
+        'languages',
+        'plotLines',
+        'locations',
+        'items',
+        'characters',
+        'projectNotes',
+        'referenceWeekDay',
+        '_referenceDate',
+        'tree',
+        )
+
+    _YAML_FLAGS = (
+        ('renumberChapters', '_renumberChapters'),
+        ('renumberParts', '_renumberParts'),
+        ('renumberWithinParts', '_renumberWithinParts'),
+        ('romanChapterNumbers', '_romanChapterNumbers'),
+        ('romanPartNumbers', '_romanPartNumbers'),
+        ('saveWordCount', '_saveWordCount'),
+    )
+    # (YAML key, instance variable name) tuples of the boolean settings
+
+    _YAML_STRINGS = (
+        ('Author', '_authorName', False),
+        ('ChapterHeadingPrefix', '_chapterHeadingPrefix', True),
+        ('ChapterHeadingSuffix', '_chapterHeadingSuffix', True),
+        ('PartHeadingPrefix', '_partHeadingPrefix', True),
+        ('PartHeadingSuffix', '_partHeadingSuffix', True),
+        ('CustomPlotProgress', '_customPlotProgress', False),
+        ('CustomCharacterization', '_customCharacterization', False),
+        ('CustomWorldBuilding', '_customWorldBuilding', False),
+        ('CustomGoal', '_customGoal', False),
+        ('CustomConflict', '_customConflict', False),
+        ('CustomOutcome', '_customOutcome', False),
+        ('CustomChrBio', '_customChrBio', False),
+        ('CustomChrGoals', '_customChrGoals', False),
+    )
+    # (YAML key, instance variable name, quoted) tuples of the string settings
+
+    _YAML_FIELDS = tuple((key, name, get_yaml_flag) for key, name in _YAML_FLAGS) + (
+        ('workPhase', '_workPhase', _get_work_phase),
+    ) + tuple((key, name, _get_heading_affix if quoted else None) for key, name, quoted in _YAML_STRINGS)
 
     def __init__(self,
             authorName=None,
@@ -85,7 +170,7 @@ class Novel(BasicElement):
         self.projectNotes = {}
         # key = note ID, value = note instance.
         try:
-            self.referenceWeekDay = date.fromisoformat(referenceDate).weekday()
+            self.referenceWeekDay = parse_iso_date(referenceDate).weekday()
             self._referenceDate = referenceDate
             # YYYY-MM-DD
         except:
@@ -93,287 +178,54 @@ class Novel(BasicElement):
             self._referenceDate = None
         self.tree = tree
 
-    @property
-    def authorName(self):
-        return self._authorName
-
-    @authorName.setter
-    def authorName(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == str
-        if self._authorName != newVal:
-            self._authorName = newVal
-            self.on_element_change()
-
-    @property
-    def wordTarget(self):
-        return self._wordTarget
-
-    @wordTarget.setter
-    def wordTarget(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == int
-        if self._wordTarget != newVal:
-            self._wordTarget = newVal
-            self.on_element_change()
-
-    @property
-    def wordCountStart(self):
-        return self._wordCountStart
-
-    @wordCountStart.setter
-    def wordCountStart(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == int
-        if self._wordCountStart != newVal:
-            self._wordCountStart = newVal
-            self.on_element_change()
-
-    @property
-    def renumberChapters(self):
-        # True: Auto-number chapters
-        # False: Do not auto-number chapters
-        return self._renumberChapters
-
-    @renumberChapters.setter
-    def renumberChapters(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == bool
-        if self._renumberChapters != newVal:
-            self._renumberChapters = newVal
-            self.on_element_change()
-
-    @property
-    def renumberParts(self):
-        # True: Auto-number parts
-        # False: Do not auto-number parts
-        return self._renumberParts
-
-    @renumberParts.setter
-    def renumberParts(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == bool
-        if self._renumberParts != newVal:
-            self._renumberParts = newVal
-            self.on_element_change()
-
-    @property
-    def renumberWithinParts(self):
-        # True: When auto-numbering chapters, start with 1 at each part beginning
-        # False: When auto-numbering chapters, ignore parts
-        return self._renumberWithinParts
-
-    @renumberWithinParts.setter
-    def renumberWithinParts(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == bool
-        if self._renumberWithinParts != newVal:
-            self._renumberWithinParts = newVal
-            self.on_element_change()
-
-    @property
-    def romanChapterNumbers(self):
-        # True: Use Roman chapter numbers when auto-numbering
-        # False: Use Arabic chapter numbers when auto-numbering
-        return self._romanChapterNumbers
-
-    @romanChapterNumbers.setter
-    def romanChapterNumbers(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == bool
-        if self._romanChapterNumbers != newVal:
-            self._romanChapterNumbers = newVal
-            self.on_element_change()
-
-    @property
-    def romanPartNumbers(self):
-        # True: Use Roman part numbers when auto-numbering
-        # False: Use Arabic part numbers when auto-numbering
-        return self._romanPartNumbers
-
-    @romanPartNumbers.setter
-    def romanPartNumbers(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == bool
-        if self._romanPartNumbers != newVal:
-            self._romanPartNumbers = newVal
-            self.on_element_change()
-
-    @property
-    def saveWordCount(self):
-        # True: Save daily word count log
-        # False: Do not save daily word count log
-        return self._saveWordCount
-
-    @saveWordCount.setter
-    def saveWordCount(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == bool
-        if self._saveWordCount != newVal:
-            self._saveWordCount = newVal
-            self.on_element_change()
-
-    @property
-    def workPhase(self):
-        # None - Undefined
-        # 1 - Outline
-        # 2 - Draft
-        # 3 - 1st Edit
-        # 4 - 2nd Edit
-        # 5 - Done
-        return self._workPhase
-
-    @workPhase.setter
-    def workPhase(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == int
-        if self._workPhase != newVal:
-            self._workPhase = newVal
-            self.on_element_change()
-
-    @property
-    def chapterHeadingPrefix(self):
-        return self._chapterHeadingPrefix
-
-    @chapterHeadingPrefix.setter
-    def chapterHeadingPrefix(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == str
-        if self._chapterHeadingPrefix != newVal:
-            self._chapterHeadingPrefix = newVal
-            self.on_element_change()
-
-    @property
-    def chapterHeadingSuffix(self):
-        return self._chapterHeadingSuffix
-
-    @chapterHeadingSuffix.setter
-    def chapterHeadingSuffix(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == str
-        if self._chapterHeadingSuffix != newVal:
-            self._chapterHeadingSuffix = newVal
-            self.on_element_change()
-
-    @property
-    def partHeadingPrefix(self):
-        return self._partHeadingPrefix
-
-    @partHeadingPrefix.setter
-    def partHeadingPrefix(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == str
-        if self._partHeadingPrefix != newVal:
-            self._partHeadingPrefix = newVal
-            self.on_element_change()
-
-    @property
-    def partHeadingSuffix(self):
-        return self._partHeadingSuffix
-
-    @partHeadingSuffix.setter
-    def partHeadingSuffix(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == str
-        if self._partHeadingSuffix != newVal:
-            self._partHeadingSuffix = newVal
-            self.on_element_change()
-
-    @property
-    def customPlotProgress(self):
-        return self._customPlotProgress
-
-    @customPlotProgress.setter
-    def customPlotProgress(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == str
-        if self._customPlotProgress != newVal:
-            self._customPlotProgress = newVal
-            self.on_element_change()
-
-    @property
-    def customCharacterization(self):
-        return self._customCharacterization
-
-    @customCharacterization.setter
-    def customCharacterization(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == str
-        if self._customCharacterization != newVal:
-            self._customCharacterization = newVal
-            self.on_element_change()
-
-    @property
-    def customWorldBuilding(self):
-        return self._customWorldBuilding
-
-    @customWorldBuilding.setter
-    def customWorldBuilding(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == str
-        if self._customWorldBuilding != newVal:
-            self._customWorldBuilding = newVal
-            self.on_element_change()
-
-    @property
-    def customGoal(self):
-        return self._customGoal
-
-    @customGoal.setter
-    def customGoal(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == str
-        if self._customGoal != newVal:
-            self._customGoal = newVal
-            self.on_element_change()
-
-    @property
-    def customConflict(self):
-        return self._customConflict
-
-    @customConflict.setter
-    def customConflict(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == str
-        if self._customConflict != newVal:
-            self._customConflict = newVal
-            self.on_element_change()
-
-    @property
-    def customOutcome(self):
-        return self._customOutcome
-
-    @customOutcome.setter
-    def customOutcome(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == str
-        if self._customOutcome != newVal:
-            self._customOutcome = newVal
-            self.on_element_change()
-
-    @property
-    def customChrBio(self):
-        return self._customChrBio
-
-    @customChrBio.setter
-    def customChrBio(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == str
-        if self._customChrBio != newVal:
-            self._customChrBio = newVal
-            self.on_element_change()
-
-    @property
-    def customChrGoals(self):
-        return self._customChrGoals
-
-    @customChrGoals.setter
-    def customChrGoals(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == str
-        if self._customChrGoals != newVal:
-            self._customChrGoals = newVal
-            self.on_element_change()
+    authorName = tracked_property('_authorName', str)
+    wordTarget = tracked_property('_wordTarget', int)
+    wordCountStart = tracked_property('_wordCountStart', int)
+
+    renumberChapters = tracked_property('_renumberChapters', bool)
+    # True: Auto-number chapters
+    # False: Do not auto-number chapters
+
+    renumberParts = tracked_property('_renumberParts', bool)
+    # True: Auto-number parts
+    # False: Do not auto-number parts
+
+    renumberWithinParts = tracked_property('_renumberWithinParts', bool)
+    # True: When auto-numbering chapters, start with 1 at each part beginning
+    # False: When auto-numbering chapters, ignore parts
+
+    romanChapterNumbers = tracked_property('_romanChapterNumbers', bool)
+    # True: Use Roman chapter numbers when auto-numbering
+    # False: Use Arabic chapter numbers when auto-numbering
+
+    romanPartNumbers = tracked_property('_romanPartNumbers', bool)
+    # True: Use Roman part numbers when auto-numbering
+    # False: Use Arabic part numbers when auto-numbering
+
+    saveWordCount = tracked_property('_saveWordCount', bool)
+    # True: Save daily word count log
+    # False: Do not save daily word count log
+
+    workPhase = tracked_property('_workPhase', int)
+    # None - Undefined
+    # 1 - Outline
+    # 2 - Draft
+    # 3 - 1st Edit
+    # 4 - 2nd Edit
+    # 5 - Done
+
+    chapterHeadingPrefix = tracked_property('_chapterHeadingPrefix', str)
+    chapterHeadingSuffix = tracked_property('_chapterHeadingSuffix', str)
+    partHeadingPrefix = tracked_property('_partHeadingPrefix', str)
+    partHeadingSuffix = tracked_property('_partHeadingSuffix', str)
+    customPlotProgress = tracked_property('_customPlotProgress', str)
+    customCharacterization = tracked_property('_customCharacterization', str)
+    customWorldBuilding = tracked_property('_customWorldBuilding', str)
+    customGoal = tracked_property('_customGoal', str)
+    customConflict = tracked_property('_customConflict', str)
+    customOutcome = tracked_property('_customOutcome', str)
+    customChrBio = tracked_property('_customChrBio', str)
+    customChrGoals = tracked_property('_customChrGoals', str)
 
     @property
     def referenceDate(self):
@@ -381,8 +233,7 @@ class Novel(BasicElement):
 
     @referenceDate.setter
     def referenceDate(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == str
+        assert newVal is None or type(newVal) is str
         if self._referenceDate != newVal:
             if not newVal:
                 self._referenceDate = None
@@ -390,7 +241,7 @@ class Novel(BasicElement):
                 self.on_element_change()
             else:
                 try:
-                    self.referenceWeekDay = date.fromisoformat(newVal).weekday()
+                    self.referenceWeekDay = parse_iso_date(newVal).weekday()
                 except:
                     pass
                     # date and week day remain unchanged
@@ -400,144 +251,60 @@ class Novel(BasicElement):
 
     def from_yaml(self, yaml):
         super().from_yaml(yaml)
-        self.renumberChapters = self._get_meta_value('renumberChapters', None) == '1'
-        self.renumberParts = self._get_meta_value('renumberParts', None) == '1'
-        self.renumberWithinParts = self._get_meta_value('renumberWithinParts', None) == '1'
-        self.romanChapterNumbers = self._get_meta_value('romanChapterNumbers', None) == '1'
-        self.romanPartNumbers = self._get_meta_value('romanPartNumbers', None) == '1'
-        self.saveWordCount = self._get_meta_value('saveWordCount', None) == '1'
-        workPhase = self._get_meta_value('workPhase', None)
-        if workPhase in ('1', '2', '3', '4', '5'):
-            self.workPhase = int(workPhase)
-        else:
-            self.workPhase = None
-
-        # Author.
-        self.authorName = self._get_meta_value('Author')
-
-        # Chapter heading prefix/suffix.
-        chapterHeadingPrefix = self._get_meta_value('ChapterHeadingPrefix')
-        if chapterHeadingPrefix:
-            chapterHeadingPrefix = chapterHeadingPrefix[1:-1]
-        self.chapterHeadingPrefix = chapterHeadingPrefix
-
-        chapterHeadingSuffix = self._get_meta_value('ChapterHeadingSuffix')
-        if chapterHeadingSuffix:
-            chapterHeadingSuffix = chapterHeadingSuffix[1:-1]
-        self.chapterHeadingSuffix = chapterHeadingSuffix
-
-        # Part heading prefix/suffix.
-        partHeadingPrefix = self._get_meta_value('PartHeadingPrefix')
-        if partHeadingPrefix:
-            partHeadingPrefix = partHeadingPrefix[1:-1]
-        self.partHeadingPrefix = partHeadingPrefix
-
-        partHeadingSuffix = self._get_meta_value('PartHeadingSuffix')
-        if partHeadingSuffix:
-            partHeadingSuffix = partHeadingSuffix[1:-1]
-        self.partHeadingSuffix = partHeadingSuffix
-
-        # N/A Goal/Conflict/Outcome.
-        self.customPlotProgress = self._get_meta_value('CustomPlotProgress')
-        self.customCharacterization = self._get_meta_value('CustomCharacterization')
-        self.customWorldBuilding = self._get_meta_value('CustomWorldBuilding')
-
-        # Custom Goal/Conflict/Outcome.
-        self.customGoal = self._get_meta_value('CustomGoal')
-        self.customConflict = self._get_meta_value('CustomConflict')
-        self.customOutcome = self._get_meta_value('CustomOutcome')
-
-        # Custom Character Bio/Goals.
-        self.customChrBio = self._get_meta_value('CustomChrBio')
-        self.customChrGoals = self._get_meta_value('CustomChrGoals')
+        metaDict = self._metaDict
+        self._load_yaml_fast(metaDict)
 
         # Word count start/Word target.
-        ws = self._get_meta_value('WordCountStart')
+        ws = metaDict.get('WordCountStart', None)
         if ws is not None:
             self.wordCountStart = int(ws)
-        wt = self._get_meta_value('WordTarget')
+        wt = metaDict.get('WordTarget', None)
         if wt is not None:
             self.wordTarget = int(wt)
 
         # Reference date.
-        self.referenceDate = verified_date(self._get_meta_value('ReferenceDate'))
+        self.referenceDate = verified_date(metaDict.get('ReferenceDate', None))
 
     def to_yaml(self, yaml):
         yaml = super().to_yaml(yaml)
-        if self.renumberChapters:
-            yaml.append(f'renumberChapters: 1')
-        if self.renumberParts:
-            yaml.append(f'renumberParts: 1')
-        if self.renumberWithinParts:
-            yaml.append(f'renumberWithinParts: 1')
-        if self.romanChapterNumbers:
-            yaml.append(f'romanChapterNumbers: 1')
-        if self.romanPartNumbers:
-            yaml.append(f'romanPartNumbers: 1')
-        if self.saveWordCount:
-            yaml.append(f'saveWordCount: 1')
-        if self.workPhase is not None:
-            yaml.append(f'workPhase: {self.workPhase}')
-
-        # Author.
-        if self.authorName:
-            yaml.append(f'Author: {self.authorName}')
-
-        # Chapter heading prefix/suffix.
-        if self.chapterHeadingPrefix:
-            yaml.append(f'ChapterHeadingPrefix: "{self.chapterHeadingPrefix}"')
-        if self.chapterHeadingSuffix:
-            yaml.append(f'ChapterHeadingSuffix: "{self.chapterHeadingSuffix}"')
-
-        # Part heading prefix/suffix.
-        if self.partHeadingPrefix:
-            yaml.append(f'PartHeadingPrefix: "{self.partHeadingPrefix}"')
-        if self.partHeadingSuffix:
-            yaml.append(f'PartHeadingSuffix: "{self.partHeadingSuffix}"')
-
-        # Custom Plot progress/Characterization/World building.
-        if self.customPlotProgress:
-            yaml.append(f'CustomPlotProgress: {self.customPlotProgress}')
-        if self.customCharacterization:
-            yaml.append(f'CustomCharacterization: {self.customCharacterization}')
-        if self.customWorldBuilding:
-            yaml.append(f'CustomWorldBuilding: {self.customWorldBuilding}')
-
-        # Custom Goal/Conflict/Outcome.
-        if self.customGoal:
-            yaml.append(f'CustomGoal: {self.customGoal}')
-        if self.customConflict:
-            yaml.append(f'CustomConflict: {self.customConflict}')
-        if self.customOutcome:
-            yaml.append(f'CustomOutcome: {self.customOutcome}')
-
-        # Custom Character Bio/Goals.
-        if self.customChrBio:
-            yaml.append(f'CustomChrBio: {self.customChrBio}')
-        if self.customChrGoals:
-            yaml.append(f'CustomChrGoals: {self.customChrGoals}')
-
-        # Word count start/Word target.
-        if self.wordCountStart:
-            yaml.append(f'WordCountStart: {self.wordCountStart}')
-        if self.wordTarget:
-            yaml.append(f'WordTarget: {self.wordTarget}')
-
-        # Reference date.
-        if self.referenceDate:
-            yaml.append(f'ReferenceDate: {self.referenceDate}')
+        yaml.extend(f'{key}: 1' for key, name in self._YAML_FLAGS if getattr(self, name))
+        if self._workPhase is not None:
+            yaml.append(f'workPhase: {self._workPhase}')
+        yaml.extend(self._iter_yaml_strings())
+        yaml.extend(filter(None, (
+            f'WordCountStart: {self._wordCountStart}' if self._wordCountStart else None,
+            f'WordTarget: {self._wordTarget}' if self._wordTarget else None,
+            f'ReferenceDate: {self._referenceDate}' if self._referenceDate else None,
+        )))
         return yaml
 
     def update_plot_lines(self):
         """Set section back references to PlotLine.sections and PlotPoint.sectionAssoc. """
-        for scId in self.sections:
-            self.sections[scId].scPlotPoints = {}
-            self.sections[scId].scPlotLines = []
-            for plId in self.plotLines:
-                if scId in self.plotLines[plId].sections:
-                    self.sections[scId].scPlotLines.append(plId)
-                    for ppId in self.tree.get_children(plId):
-                        if self.plotPoints[ppId].sectionAssoc == scId:
-                            self.sections[scId].scPlotPoints[ppId] = plId
-                            break
-
+        sections = self.sections
+        plotPoints = self.plotPoints
+        get_children = self.tree.get_children
+        for section in sections.values():
+            section.scPlotPoints = {}
+            section.scPlotLines = []
+        for plId, plotLine in self.plotLines.items():
+            plSections = set()
+            for scId in plotLine.sections:
+                if scId in sections and not scId in plSections:
+                    sections[scId].scPlotLines.append(plId)
+                    plSections.add(scId)
+            for ppId in get_children(plId):
+                scId = plotPoints[ppId].sectionAssoc
+                if scId in plSections:
+                    sections[scId].scPlotPoints[ppId] = plId
+                    plSections.discard(scId)
+                    # only the first plot point of the plot line refers back
+
+    def _iter_yaml_strings(self):
+        """Generate the YAML lines of the string settings that are set."""
+        for key, name, quoted in self._YAML_STRINGS:
+            value = getattr(self, name)
+            if value:
+                if quoted:
+                    yield f'{key}: "{value}"'
+                else:
+                    yield f'{key}: {value}'
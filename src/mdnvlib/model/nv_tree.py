@@ -36,6 +36,13 @@ class NvTree:
         self.srtTurningPoints = {}
         # key: plot line ID
         # value : plot point ID
+        self._branches = {
+            CHAPTER_PREFIX:self.srtSections,
+            PLOT_LINE_PREFIX:self.srtTurningPoints,
+        }
+        # key: ID prefix of the parent elements
+        # value: dictionary of the parents' children
+        # the dictionaries are cleared, not replaced, to keep these references valid
 
     def append(self, parent, iid):
         """Creates a new item with identifier iid."""
@@ -47,18 +54,9 @@ class NvTree:
                 self.srtTurningPoints[iid] = []
             return
 
-        if parent.startswith(CHAPTER_PREFIX):
-            if parent in self.srtSections:
-                self.srtSections[parent].append(iid)
-            else:
-                self.srtSections[parent] = [iid]
-            return
-
-        if parent.startswith(PLOT_LINE_PREFIX):
-            if parent in self.srtTurningPoints:
-                self.srtTurningPoints[parent].append(iid)
-            else:
-                self.srtTurningPoints[parent] = [iid]
+        branch = self._branches.get(parent[:2], None)
+        if branch is not None:
+            branch.setdefault(parent, []).append(iid)
 
     def delete(self, *items):
         """Delete all specified items and all their descendants. The root
@@ -70,30 +68,25 @@ class NvTree:
         if parent in self.roots:
             self.roots[parent] = []
             if parent == CH_ROOT:
-                self.srtSections = {}
+                self.srtSections.clear()
                 return
 
             if parent == PL_ROOT:
-                self.srtTurningPoints = {}
+                self.srtTurningPoints.clear()
             return
 
-        if parent.startswith(CHAPTER_PREFIX):
-            self.srtSections[parent] = []
-            return
-
-        if parent.startswith(PLOT_LINE_PREFIX):
-            self.srtTurningPoints[parent] = []
+        branch = self._branches.get(parent[:2], None)
+        if branch is not None:
+            branch[parent] = []
 
     def get_children(self, item):
         """Returns the list of children belonging to item."""
         if item in self.roots:
             return self.roots[item]
 
-        if item.startswith(CHAPTER_PREFIX):
-            return self.srtSections.get(item, [])
-
-        if item.startswith(PLOT_LINE_PREFIX):
-            return self.srtTurningPoints.get(item, [])
+        branch = self._branches.get(item[:2], None)
+        if branch is not None:
+            return branch.get(item, [])
 
     def index(self, item):
         """Return the integer index of item within its parent's list
@@ -110,18 +103,9 @@ class NvTree:
                 self.srtTurningPoints[iid] = []
             return
 
-        if parent.startswith(CHAPTER_PREFIX):
-            if parent in self.srtSections:
-                self.srtSections[parent].insert(index, iid)
-            else:
-                self.srtSections[parent] = [iid]
-            return
-
-        if parent.startswith(PLOT_LINE_PREFIX):
-            if parent in self.srtTurningPoints:
-                self.srtTurningPoints[parent].insert(index, iid)
-            else:
-                self.srtTurningPoints[parent] = [iid]
+        branch = self._branches.get(parent[:2], None)
+        if branch is not None:
+            branch.setdefault(parent, []).insert(index, iid)
 
     def move(self, item, parent, index):
         """Move item to position index in parent's list of children.
@@ -152,25 +136,22 @@ class NvTree:
         """Clear the tree."""
         for item in self.roots:
             self.roots[item] = []
-        self.srtSections = {}
-        self.srtTurningPoints = {}
+        self.srtSections.clear()
+        self.srtTurningPoints.clear()
 
     def set_children(self, item, newchildren):
         """Replaces item’s child with newchildren."""
         if item in self.roots:
             self.roots[item] = newchildren[:]
             if item == CH_ROOT:
-                self.srtSections = {}
+                self.srtSections.clear()
                 return
 
             if item == PL_ROOT:
-                self.srtTurningPoints = {}
-            return
-
-        if item.startswith(CHAPTER_PREFIX):
-            self.srtSections[item] = newchildren[:]
+                self.srtTurningPoints.clear()
             return
 
-        if item.startswith(PLOT_LINE_PREFIX):
-            self.srtTurningPoints[item] = newchildren[:]
+        branch = self._branches.get(item[:2], None)
+        if branch is not None:
+            branch[item] = newchildren[:]
 
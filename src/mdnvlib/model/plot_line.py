@@ -4,13 +4,24 @@ Copyright (c) 2024 Peter Triesberger
 For further information see https://github.com/peter88213/mdnvlib
 License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
 """
+from mdnvlib.model.basic_element import all_strings
+from mdnvlib.model.basic_element import get_id_tuple
+from mdnvlib.model.basic_element import tracked_property
 from mdnvlib.model.basic_element_notes import BasicElementNotes
-from mdnvlib.novx_globals import string_to_list
 from mdnvlib.novx_globals import list_to_string
 
 
 class PlotLine(BasicElementNotes):
     """Plot line representation."""
+    __slots__ = (
+        '_shortName',
+        '_sections',
+        )
+
+    _YAML_FIELDS = (
+        ('ShortName', '_shortName', None),
+        ('Sections', '_sections', get_id_tuple),
+    )
 
     def __init__(self,
             shortName=None,
@@ -20,49 +31,35 @@ class PlotLine(BasicElementNotes):
         super().__init__(**kwargs)
 
         self._shortName = shortName
+        if sections is not None:
+            sections = tuple(sections)
         self._sections = sections
 
-    @property
-    def shortName(self):
-        # str: name of the plot line
-        return self._shortName
-
-    @shortName.setter
-    def shortName(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == str
-        if self._shortName != newVal:
-            self._shortName = newVal
-            self.on_element_change()
+    shortName = tracked_property('_shortName', str)
+    # str: name of the plot line
 
     @property
     def sections(self):
-        # List of str: IDs of the sections associated with the plot line.
-        try:
-            return self._sections[:]
-        except TypeError:
-            return None
+        # tuple of IDs of the sections associated with the plot line
+        return self._sections
 
     @sections.setter
     def sections(self, newVal):
         if newVal is not None:
-            for elem in newVal:
-                if elem is not None:
-                    assert type(elem) == str
+            newVal = tuple(newVal)
+            assert all_strings(newVal)
         if self._sections != newVal:
             self._sections = newVal
             self.on_element_change()
 
     def from_yaml(self, yaml):
         super().from_yaml(yaml)
-        self.shortName = self._get_meta_value('ShortName')
-        plSections = self._get_meta_value('Sections')
-        self.sections = string_to_list(plSections)
+        self._load_yaml_fast(self._metaDict)
 
     def to_yaml(self, yaml):
         yaml = super().to_yaml(yaml)
-        if self.shortName:
-            yaml.append(f'ShortName: {self.shortName}')
-        if self.sections:
-            yaml.append(f'Sections: {list_to_string(self.sections)}')
+        yaml.extend(filter(None, (
+            f'ShortName: {self._shortName}' if self._shortName else None,
+            f'Sections: {list_to_string(self._sections)}' if self._sections else None,
+        )))
         return yaml
@@ -4,11 +4,17 @@ Copyright (c) 2024 Peter Triesberger
 For further information see https://github.com/peter88213/mdnvlib
 License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
 """
+from mdnvlib.model.basic_element import tracked_property
 from mdnvlib.model.basic_element_notes import BasicElementNotes
 
 
 class PlotPoint(BasicElementNotes):
     """Plot point representation."""
+    __slots__ = ('_sectionAssoc',)
+
+    _YAML_FIELDS = (
+        ('Section', '_sectionAssoc', None),
+    )
 
     def __init__(self,
             sectionAssoc=None,
@@ -18,22 +24,12 @@ class PlotPoint(BasicElementNotes):
 
         self._sectionAssoc = sectionAssoc
 
-    @property
-    def sectionAssoc(self):
-        # str: ID of the associated section
-        return self._sectionAssoc
-
-    @sectionAssoc.setter
-    def sectionAssoc(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == str
-        if self._sectionAssoc != newVal:
-            self._sectionAssoc = newVal
-            self.on_element_change()
+    sectionAssoc = tracked_property('_sectionAssoc', str)
+    # str: ID of the associated section
 
     def from_yaml(self, yaml):
         super().from_yaml(yaml)
-        self.sectionAssoc = self._get_meta_value('Section')
+        self._load_yaml_fast(self._metaDict)
 
     def to_yaml(self, yaml):
         yaml = super().to_yaml(yaml)
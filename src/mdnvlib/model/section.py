@@ -6,16 +6,22 @@ License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
 """
 from datetime import date
 from datetime import datetime
-from datetime import time
 from datetime import timedelta
+from functools import lru_cache
 import re
+from types import MappingProxyType
 
+from mdnvlib.model.basic_element import all_strings
+from mdnvlib.model.basic_element import get_id_tuple
+from mdnvlib.model.basic_element import get_yaml_flag
+from mdnvlib.model.basic_element import tracked_property
 from mdnvlib.model.basic_element_tags import BasicElementTags
 from mdnvlib.model.date_time_tools import get_specific_date
 from mdnvlib.model.date_time_tools import get_unspecific_date
 from mdnvlib.novx_globals import _
 from mdnvlib.novx_globals import list_to_string
-from mdnvlib.novx_globals import string_to_list
+from mdnvlib.novx_globals import parse_iso_date
+from mdnvlib.novx_globals import parse_iso_time
 from mdnvlib.novx_globals import verified_date
 from mdnvlib.novx_globals import verified_int_string
 from mdnvlib.novx_globals import verified_time
@@ -25,29 +31,105 @@ from mdnvlib.novx_globals import verified_time
 ADDITIONAL_WORD_LIMITS = re.compile(r'--|—|–|\<\/p\>')
 # this is to be replaced by spaces when counting words
 
-NO_WORD_LIMITS = re.compile(r'\<note\>.*?\<\/note\>|\<comment\>.*?\<\/comment\>|\<.+?\>')
-# this is to be replaced by empty strings when counting words
+NO_WORD_LIMITS = re.compile(r'\<note\>.*?\<\/note\>|\<comment\>.*?\<\/comment\>|\<.[^>\n]*\>')
+# this is to be replaced by empty strings when counting words;
+# the tag pattern matches like "<.+?>", but without lazy backtracking
+
+
+def _get_section_type(typeStr):
+    """Return the scType value for a YAML type string."""
+    if typeStr is None:
+        return 0
+
+    if typeStr in ('0', '1', '2', '3'):
+        return int(typeStr)
+
+    return 1
+
+
+def _get_section_status(status):
+    """Return the status value for a YAML status string."""
+    if status in ('2', '3', '4', '5'):
+        return int(status)
+
+    return 1
+
+
+def _get_scene_kind(scene):
+    """Return the scene value for a YAML scene string."""
+    if scene in ('1', '2', '3'):
+        return int(scene)
+
+    return 0
+
+
+@lru_cache(maxsize=4096)
+def _get_locale_date(isoDate):
+    """Return the preferred representation of a valid iso date for the current locale."""
+    try:
+        return parse_iso_date(isoDate).strftime('%x')
+
+    except:
+        return isoDate
 
 
 class Section(BasicElementTags):
     """mdnovel section representation."""
-
-    SCENE = ['-', 'A', 'R', 'x']
+    __slots__ = (
+        '_sectionContent',
+        'wordCount',
+        '_scType',
+        '_scene',
+        '_status',
+        '_appendToPrev',
+        '_goal',
+        '_conflict',
+        '_outcome',
+        '_plotlineNotes',
+        '_plotlineNotesView',
+        '_date',
+        '_time',
+        '_day',
+        '_lastsMinutes',
+        '_lastsHours',
+        '_lastsDays',
+        '_characters',
+        '_locations',
+        '_items',
+        'scPlotLines',
+        'scPlotPoints',
+        )
+
+    SCENE = ('-', 'A', 'R', 'x')
     # emulating an enumeration for the scene Action/Reaction/Other type
 
-    STATUS = [
+    STATUS = (
         None,
         _('Outline'),
         _('Draft'),
         _('1st Edit'),
         _('2nd Edit'),
         _('Done')
-    ]
+    )
     # emulating an enumeration for the section completion status
 
     NULL_DATE = '0001-01-01'
     NULL_TIME = '00:00:00'
 
+    _YAML_FIELDS = (
+        ('type', '_scType', _get_section_type),
+        ('status', '_status', _get_section_status),
+        ('scene', '_scene', _get_scene_kind),
+        ('append', '_appendToPrev', get_yaml_flag),
+        ('Time', '_time', verified_time),
+        ('LastsDays', '_lastsDays', verified_int_string),
+        ('LastsHours', '_lastsHours', verified_int_string),
+        ('LastsMinutes', '_lastsMinutes', verified_int_string),
+        ('Characters', '_characters', get_id_tuple),
+        ('Locations', '_locations', get_id_tuple),
+        ('Items', '_items', get_id_tuple),
+    )
+
     def __init__(self,
             scType=None,
             scene=None,
@@ -82,22 +164,28 @@ class Section(BasicElementTags):
         self._conflict = conflict
         self._outcome = outcome
         self._plotlineNotes = plotNotes
+        if plotNotes is None:
+            self._plotlineNotesView = None
+        else:
+            self._plotlineNotesView = MappingProxyType(plotNotes)
         try:
-            newDate = date.fromisoformat(scDate)
-            self._weekDay = newDate.weekday()
-            self._localeDate = newDate.strftime('%x')
+            parse_iso_date(scDate)
             self._date = scDate
         except:
-            self._weekDay = None
-            self._localeDate = None
             self._date = None
         self._time = scTime
         self._day = day
         self._lastsMinutes = lastsMinutes
         self._lastsHours = lastsHours
         self._lastsDays = lastsDays
+        if characters is not None:
+            characters = tuple(characters)
         self._characters = characters
+        if locations is not None:
+            locations = tuple(locations)
         self._locations = locations
+        if items is not None:
+            items = tuple(items)
         self._items = items
 
         self.scPlotLines = []
@@ -113,135 +201,62 @@ class Section(BasicElementTags):
     @sectionContent.setter
     def sectionContent(self, text):
         """Set sectionContent updating word count and letter count."""
-        if text is not None:
-            assert type(text) == str
+        assert text is None or type(text) is str
         if self._sectionContent != text:
             self._sectionContent = text
             if text is not None:
-                text = ADDITIONAL_WORD_LIMITS.sub(' ', text)
-                text = NO_WORD_LIMITS.sub('', text)
-                wordList = text.split()
-                self.wordCount = len(wordList)
+                if '<' in text or '-' in text or '—' in text or '–' in text:
+                    text = ADDITIONAL_WORD_LIMITS.sub(' ', text)
+                    if '<' in text:
+                        text = NO_WORD_LIMITS.sub('', text)
+                # Otherwise, there is nothing to be replaced, so skip the regex scans.
+                self.wordCount = len(text.split())
             else:
                 self.wordCount = 0
             self.on_element_change()
 
-    @property
-    def scType(self):
-        # 0 = Normal
-        # 1 = Unused
-        # 2 = Level 1 stage
-        # 3 = Level 2 stage
-        return self._scType
-
-    @scType.setter
-    def scType(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == int
-        if self._scType != newVal:
-            self._scType = newVal
-            self.on_element_change()
-
-    @property
-    def scene(self):
-        # 0 = not a scene
-        # 1 = action scene
-        # 2 = reaction scene
-        # 3 = other scene
-        return self._scene
-
-    @scene.setter
-    def scene(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == int
-        if self._scene != newVal:
-            self._scene = newVal
-            self.on_element_change()
-
-    @property
-    def status(self):
-        # 1 - Outline
-        # 2 - Draft
-        # 3 - 1st Edit
-        # 4 - 2nd Edit
-        # 5 - Done
-        return self._status
-
-    @status.setter
-    def status(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == int
-        if self._status != newVal:
-            self._status = newVal
-            self.on_element_change()
-
-    @property
-    def appendToPrev(self):
-        # True - append this section to the previous one without a section separator
-        # False - put a section separator between this section and the previous one
-        return self._appendToPrev
-
-    @appendToPrev.setter
-    def appendToPrev(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == bool
-        if self._appendToPrev != newVal:
-            self._appendToPrev = newVal
-            self.on_element_change()
-
-    @property
-    def goal(self):
-        return self._goal
-
-    @goal.setter
-    def goal(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == str
-        if self._goal != newVal:
-            self._goal = newVal
-            self.on_element_change()
-
-    @property
-    def conflict(self):
-        return self._conflict
-
-    @conflict.setter
-    def conflict(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == str
-        if self._conflict != newVal:
-            self._conflict = newVal
-            self.on_element_change()
-
-    @property
-    def outcome(self):
-        return self._outcome
-
-    @outcome.setter
-    def outcome(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == str
-        if self._outcome != newVal:
-            self._outcome = newVal
-            self.on_element_change()
+    scType = tracked_property('_scType', int)
+    # 0 = Normal
+    # 1 = Unused
+    # 2 = Level 1 stage
+    # 3 = Level 2 stage
+
+    scene = tracked_property('_scene', int)
+    # 0 = not a scene
+    # 1 = action scene
+    # 2 = reaction scene
+    # 3 = other scene
+
+    status = tracked_property('_status', int)
+    # 1 - Outline
+    # 2 - Draft
+    # 3 - 1st Edit
+    # 4 - 2nd Edit
+    # 5 - Done
+
+    appendToPrev = tracked_property('_appendToPrev', bool)
+    # True - append this section to the previous one without a section separator
+    # False - put a section separator between this section and the previous one
+
+    goal = tracked_property('_goal', str)
+    conflict = tracked_property('_conflict', str)
+    outcome = tracked_property('_outcome', str)
 
     @property
     def plotlineNotes(self):
         # Dict of {plot line ID: text}
-        try:
-            return dict(self._plotlineNotes)
-        except TypeError:
-            return None
+        # Return a read-only view; for changes, assign a new dict.
+        return self._plotlineNotesView
 
     @plotlineNotes.setter
     def plotlineNotes(self, newVal):
-        if newVal is not None:
-            for elem in newVal:
-                val = newVal[elem]
-                if val is not None:
-                    assert type(val) == str
+        assert newVal is None or all_strings(newVal.values())
         if self._plotlineNotes != newVal:
             self._plotlineNotes = newVal
+            if newVal is None:
+                self._plotlineNotesView = None
+            else:
+                self._plotlineNotesView = MappingProxyType(newVal)
             self.on_element_change()
 
     @property
@@ -251,151 +266,86 @@ class Section(BasicElementTags):
 
     @date.setter
     def date(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == str
+        assert newVal is None or type(newVal) is str
         if self._date != newVal:
             if not newVal:
                 self._date = None
-                self._weekDay = None
-                self._localeDate = None
                 self.on_element_change()
                 return
 
             try:
-                newDate = date.fromisoformat(newVal)
-                self._weekDay = newDate.weekday()
+                parse_iso_date(newVal)
             except:
+                # date remains unchanged
                 return
-                # date and week day remain unchanged
 
-            try:
-                self._localeDate = newDate.strftime('%x')
-            except:
-                self._localeDate = newVal
             self._date = newVal
             self.on_element_change()
 
     @property
     def weekDay(self):
         # the number of the day ot the week
-        return self._weekDay
+        # Computed on demand from the memoized date object.
+        if self._date:
+            return parse_iso_date(self._date).weekday()
+        else:
+            return None
 
     @property
     def localeDate(self):
         # the preferred date representation for the current locale
-        return self._localeDate
-
-    @property
-    def time(self):
-        # hh:mm:ss
-        return self._time
-
-    @time.setter
-    def time(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == str
-        if self._time != newVal:
-            self._time = newVal
-            self.on_element_change()
-
-    @property
-    def day(self):
-        return self._day
-
-    @day.setter
-    def day(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == str
-        if self._day != newVal:
-            self._day = newVal
-            self.on_element_change()
-
-    @property
-    def lastsMinutes(self):
-        return self._lastsMinutes
-
-    @lastsMinutes.setter
-    def lastsMinutes(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == str
-        if self._lastsMinutes != newVal:
-            self._lastsMinutes = newVal
-            self.on_element_change()
-
-    @property
-    def lastsHours(self):
-        return self._lastsHours
-
-    @lastsHours.setter
-    def lastsHours(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == str
-        if self._lastsHours != newVal:
-            self._lastsHours = newVal
-            self.on_element_change()
+        # Computed on demand, since most sections never display it.
+        if self._date:
+            return _get_locale_date(self._date)
+        else:
+            return None
 
-    @property
-    def lastsDays(self):
-        return self._lastsDays
+    time = tracked_property('_time', str)
+    # hh:mm:ss
 
-    @lastsDays.setter
-    def lastsDays(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == str
-        if self._lastsDays != newVal:
-            self._lastsDays = newVal
-            self.on_element_change()
+    day = tracked_property('_day', str)
+    lastsMinutes = tracked_property('_lastsMinutes', str)
+    lastsHours = tracked_property('_lastsHours', str)
+    lastsDays = tracked_property('_lastsDays', str)
 
     @property
     def characters(self):
-        # list of character IDs
-        try:
-            return self._characters[:]
-        except TypeError:
-            return None
+        # tuple of character IDs
+        return self._characters
 
     @characters.setter
     def characters(self, newVal):
         if newVal is not None:
-            for elem in newVal:
-                if elem is not None:
-                    assert type(elem) == str
+            newVal = tuple(newVal)
+            assert all_strings(newVal)
         if self._characters != newVal:
             self._characters = newVal
             self.on_element_change()
 
     @property
     def locations(self):
-        # List of location IDs
-        try:
-            return self._locations[:]
-        except TypeError:
-            return None
+        # Tuple of location IDs
+        return self._locations
 
     @locations.setter
     def locations(self, newVal):
         if newVal is not None:
-            for elem in newVal:
-                if elem is not None:
-                    assert type(elem) == str
+            newVal = tuple(newVal)
+            assert all_strings(newVal)
         if self._locations != newVal:
             self._locations = newVal
             self.on_element_change()
 
     @property
     def items(self):
-        # List of Item IDs
-        try:
-            return self._items[:]
-        except TypeError:
-            return None
+        # Tuple of Item IDs
+        return self._items
 
     @items.setter
     def items(self, newVal):
         if newVal is not None:
-            for elem in newVal:
-                if elem is not None:
-                    assert type(elem) == str
+            newVal = tuple(newVal)
+            assert all_strings(newVal)
         if self._items != newVal:
             self._items = newVal
             self.on_element_change()
@@ -442,55 +392,21 @@ class Section(BasicElementTags):
 
     def from_yaml(self, yaml):
         super().from_yaml(yaml)
+        metaDict = self._metaDict
 
-        # Attributes.
-        typeStr = self._get_meta_value('type', '0')
-        if typeStr in ('0', '1', '2', '3'):
-            self.scType = int(typeStr)
-        else:
-            self.scType = 1
-        status = self._get_meta_value('status', None)
-        if status in ('2', '3', '4', '5'):
-            self.status = int(status)
-        else:
-            self.status = 1
-        scene = self._get_meta_value('scene', 0)
-        if scene in ('1', '2', '3'):
-            self.scene = int(scene)
-        else:
-            self.scene = 0
+        # Attributes, Time, Duration, and references.
+        self._load_yaml_fast(metaDict)
 
-        if not self.scene:
+        if not self._scene:
             # looking for deprecated attribute from DTD 1.3
-            sceneKind = self._get_meta_value('pacing', None)
+            sceneKind = metaDict.get('pacing', None)
             if sceneKind in ('1', '2'):
-                self.scene = int(sceneKind) + 1
-
-        self.appendToPrev = self._get_meta_value('append', None) == '1'
+                self._scene = int(sceneKind) + 1
 
-        # Date/Day and Time.
-        self.date = verified_date(self._get_meta_value('Date'))
+        # Date/Day.
+        self.date = verified_date(metaDict.get('Date', None))
         if not self.date:
-            self.day = verified_int_string(self._get_meta_value('Day'))
-
-        self.time = verified_time(self._get_meta_value('Time'))
-
-        # Duration.
-        self.lastsDays = verified_int_string(self._get_meta_value('LastsDays'))
-        self.lastsHours = verified_int_string(self._get_meta_value('LastsHours'))
-        self.lastsMinutes = verified_int_string(self._get_meta_value('LastsMinutes'))
-
-        # Characters references.
-        scCharacters = self._get_meta_value('Characters')
-        self.characters = string_to_list(scCharacters)
-
-        # Locations references.
-        scLocations = self._get_meta_value('Locations')
-        self.locations = string_to_list(scLocations)
-
-        # Items references.
-        scItems = self._get_meta_value('Items')
-        self.items = string_to_list(scItems)
+            self.day = verified_int_string(metaDict.get('Day', None))
 
     def get_end_date_time(self):
         """Return the end (date, time, day) tuple calculated from start and duration."""
@@ -508,67 +424,51 @@ class Section(BasicElementTags):
         if self.lastsMinutes:
             lastsSeconds += int(self.lastsMinutes) * 60
         sectionDuration = timedelta(days=lastsDays, seconds=lastsSeconds)
-        if self.time:
-            if self.date:
+        if self._time:
+            if self._date:
                 try:
-                    sectionStart = datetime.fromisoformat(f'{self.date} {self.time}')
+                    sectionStart = datetime.combine(parse_iso_date(self._date), parse_iso_time(self._time))
                     sectionEnd = sectionStart + sectionDuration
-                    endDate, endTime = sectionEnd.isoformat().split('T')
+                    endDate = sectionEnd.date().isoformat()
+                    endTime = sectionEnd.time().isoformat()
                 except:
                     pass
             else:
                 try:
-                    if self.day:
-                        dayInt = int(self.day)
+                    if self._day:
+                        dayInt = int(self._day)
                     else:
                         dayInt = 0
-                    startDate = (date.min + timedelta(days=dayInt)).isoformat()
-                    sectionStart = datetime.fromisoformat(f'{startDate} {self.time}')
+                    startDate = date.min + timedelta(days=dayInt)
+                    sectionStart = datetime.combine(startDate, parse_iso_time(self._time))
                     sectionEnd = sectionStart + sectionDuration
-                    endDate, endTime = sectionEnd.isoformat().split('T')
-                    endDay = str((date.fromisoformat(endDate) - date.min).days)
-                    endDate = None
+                    endTime = sectionEnd.time().isoformat()
+                    endDay = str((sectionEnd.date() - date.min).days)
                 except:
                     pass
         return endDate, endTime, endDay
 
     def to_yaml(self, yaml):
         yaml = super().to_yaml(yaml)
-        if self.scType:
-            yaml.append(f'type: {self.scType}')
-        if self.status > 1:
-            yaml.append(f'status: {self.status}')
-        if self.scene > 0:
-            yaml.append(f'scene: {self.scene}')
-        if self.appendToPrev:
-            yaml.append(f'append: 1')
-
-        # Date/Day and Time.
-        if self.date:
-            yaml.append(f'Date: {self.date}')
-        elif self.day:
-            yaml.append(f'Day: {self.day}')
-        if self.time:
-            yaml.append(f'Time: {self.time}')
-
-        # Duration.
-        if self.lastsDays and self.lastsDays != '0':
-            yaml.append(f'LastsDays: {self.lastsDays}')
-        if self.lastsHours and self.lastsHours != '0':
-            yaml.append(f'LastsHours: {self.lastsHours}')
-        if self.lastsMinutes and self.lastsMinutes != '0':
-            yaml.append(f'LastsMinutes: {self.lastsMinutes}')
-
-        # Characters references.
-        if self.characters:
-            yaml.append(f'Characters: {list_to_string(self.characters)}')
-
-        # Locations references.
-        if self.locations:
-            yaml.append(f'Locations: {list_to_string(self.locations)}')
-
-        # Items references.
-        if self.items:
-            yaml.append(f'Items: {list_to_string(self.items)}')
-
+        yaml.extend(filter(None, (
+            f'type: {self._scType}' if self._scType else None,
+            f'status: {self._status}' if self._status > 1 else None,
+            f'scene: {self._scene}' if self._scene > 0 else None,
+            'append: 1' if self._appendToPrev else None,
+
+            # Date/Day and Time.
+            f'Date: {self._date}' if self._date else None,
+            f'Day: {self._day}' if self._day and not self._date else None,
+            f'Time: {self._time}' if self._time else None,
+
+            # Duration.
+            f'LastsDays: {self._lastsDays}' if self._lastsDays and self._lastsDays != '0' else None,
+            f'LastsHours: {self._lastsHours}' if self._lastsHours and self._lastsHours != '0' else None,
+            f'LastsMinutes: {self._lastsMinutes}' if self._lastsMinutes and self._lastsMinutes != '0' else None,
+
+            # Characters/Locations/Items references.
+            f'Characters: {list_to_string(self._characters)}' if self._characters else None,
+            f'Locations: {list_to_string(self._locations)}' if self._locations else None,
+            f'Items: {list_to_string(self._items)}' if self._items else None,
+        )))
         return yaml
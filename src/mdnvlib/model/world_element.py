@@ -4,11 +4,13 @@ Copyright (c) 2024 Peter Triesberger
 For further information see https://github.com/peter88213/mdnvlib
 License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
 """
+from mdnvlib.model.basic_element import tracked_property
 from mdnvlib.model.basic_element_tags import BasicElementTags
 
 
 class WorldElement(BasicElementTags):
     """Story world element representation (may be location or item)."""
+    __slots__ = ('_aka',)
 
     def __init__(self,
             aka=None,
@@ -17,21 +19,11 @@ class WorldElement(BasicElementTags):
         super().__init__(**kwargs)
         self._aka = aka
 
-    @property
-    def aka(self):
-        return self._aka
-
-    @aka.setter
-    def aka(self, newVal):
-        if newVal is not None:
-            assert type(newVal) == str
-        if self._aka != newVal:
-            self._aka = newVal
-            self.on_element_change()
+    aka = tracked_property('_aka', str)
 
     def from_yaml(self, yaml):
         super().from_yaml(yaml)
-        self.aka = self._get_meta_value('Aka')
+        self.aka = self._metaDict.get('Aka', None)
 
     def to_yaml(self, yaml):
         yaml = super().to_yaml(yaml)
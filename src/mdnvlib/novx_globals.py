@@ -8,6 +8,7 @@ from calendar import day_name
 from calendar import month_name
 from datetime import date
 from datetime import time
+from functools import lru_cache
 import gettext
 import locale
 import os
@@ -57,17 +58,29 @@ class Error(Exception):
 
 
 #--- Initialize localization.
-locale.setlocale(locale.LC_TIME, "")
+try:
+    locale.setlocale(locale.LC_TIME, "")
+    # required for localized dates, week day names, and month names
+except locale.Error:
+    pass
+    # the locale is not installed; keep the default
 LOCALE_PATH = f'{os.path.dirname(sys.argv[0])}/locale/'
 try:
     CURRENT_LANGUAGE = locale.getlocale()[0][:2]
-except:
-    # Fallback for old Windows versions.
-    CURRENT_LANGUAGE = locale.getdefaultlocale()[0][:2]
+except (TypeError, ValueError):
+    # Fallback for old Windows versions, looking up the variables that
+    # the deprecated locale.getdefaultlocale() uses, in the same order.
+    CURRENT_LANGUAGE = (
+        os.environ.get('LC_ALL')
+        or os.environ.get('LC_CTYPE')
+        or os.environ.get('LANG')
+        or os.environ.get('LANGUAGE')
+        or 'en'
+        )[:2]
 try:
     t = gettext.translation('mdnovel', LOCALE_PATH, languages=[CURRENT_LANGUAGE])
     _ = t.gettext
-except:
+except OSError:
 
     def _(message):
         return message
@@ -93,21 +106,17 @@ def string_to_list(text, divider=';'):
     
     Split a string into a list of strings. Retain the order, but discard duplicates.
     Remove leading and trailing spaces, if any.
+    Intern the elements, because they are mostly repeated IDs or tags.
     Return a list of strings.
-    If an error occurs, return an empty list.
+    If text is None or empty, return an empty list.
     """
-    elements = []
-    try:
-        tempList = text.split(divider)
-        for element in tempList:
-            element = element.strip()
-            if element and not element in elements:
-                elements.append(element)
-        return elements
-
-    except:
+    if not text:
         return []
 
+    elements = (element.strip() for element in text.split(divider))
+    # dict keys retain the insertion order
+    return list(dict.fromkeys(sys.intern(element) for element in elements if element))
+
 
 def list_to_string(elements, divider=';'):
     """Join strings from a list.
@@ -122,15 +131,13 @@ def list_to_string(elements, divider=';'):
     members of the list of strings "elements", separated by 
     a comma plus a space. The space allows word wrap in 
     spreadsheet cells.
-    If an error occurs, return an empty string.
+    If elements is None, return an empty string.
     """
-    try:
-        text = divider.join(elements)
-        return text
-
-    except:
+    if elements is None:
         return ''
 
+    return divider.join(elements)
+
 
 def intersection(elemList, refList):
     """Return a list with the intersection of elemList and refList.
@@ -140,14 +147,37 @@ def intersection(elemList, refList):
         refList: list -- Reference list.
     
     The element order is from elemList.
+    If refList is a sequence, it is converted to a set for fast lookup.
     """
+    if not isinstance(refList, (set, frozenset, dict)):
+        refList = frozenset(refList)
     return [elem for elem in elemList if elem in refList]
 
 
+@lru_cache(maxsize=4096)
+def parse_iso_date(isoDate):
+    """Return a date object for a date in isoformat.
+    
+    Raise an exception if isoDate is not an iso-formatted date.
+    The result is memoized, so each date string is parsed only once,
+    no matter whether it is verified, displayed, or calculated with.
+    """
+    return date.fromisoformat(isoDate)
+
+
+@lru_cache(maxsize=4096)
+def parse_iso_time(isoTime):
+    """Return a time object for a time in isoformat.
+    
+    Raise an exception if isoTime is not an iso-formatted time.
+    """
+    return time.fromisoformat(isoTime)
+
+
 def verified_date(dateStr):
     """Return a verified iso dateStr or None."""
     if dateStr is not None:
-        date.fromisoformat(dateStr)
+        parse_iso_date(dateStr)
         # raising an exception if dateStr is not an iso-formatted date
     return dateStr
 
@@ -163,7 +193,7 @@ def verified_int_string(intStr):
 def verified_time(timeStr):
     """Return a verified iso timeStr or None."""
     if  timeStr is not None:
-        time.fromisoformat(timeStr)
+        parse_iso_time(timeStr)
         # raising an exception if timeStr is not an iso-formatted time
         while timeStr.count(':') < 2:
             timeStr = f'{timeStr}:00'
@@ -5,7 +5,6 @@ For further information see https://github.com/peter88213/mdnvlib
 License: GNU LGPLv3 (https://www.gnu.org/licenses/lgpl-3.0.en.html)
 """
 from datetime import date
-from datetime import time
 import os
 import re
 
@@ -13,6 +12,7 @@ from mdnvlib.file.file import File
 from mdnvlib.model.basic_element import BasicElement
 from mdnvlib.model.chapter import Chapter
 from mdnvlib.model.character import Character
+from mdnvlib.model.novel import Novel
 from mdnvlib.model.plot_line import PlotLine
 from mdnvlib.model.plot_point import PlotPoint
 from mdnvlib.model.section import Section
@@ -27,12 +27,46 @@ from mdnvlib.novx_globals import PN_ROOT
 from mdnvlib.novx_globals import _
 from mdnvlib.novx_globals import list_to_string
 from mdnvlib.novx_globals import norm_path
+from mdnvlib.novx_globals import parse_iso_date
+from mdnvlib.novx_globals import parse_iso_time
 from mdnvlib.novx_globals import string_to_list
 from mdnvlib.novx_globals import verified_date
 from mdnvlib.novx_globals import verified_int_string
 from novxlib.xml_indent import indent
 import xml.etree.ElementTree as ET
 
+# Regular expressions for converting Markdown emphasis into novx markup.
+MD_STRONG = re.compile(r'\*\*(.+?)\*\*')
+MD_EMPHASIS = re.compile(r'\*(.+?)\*')
+
+# Regular expression for text that only the XML parser can handle properly:
+# markup, references, and characters that are invalid or normalized in XML.
+XML_SPECIAL = re.compile('[<&\x00-\x08\x0b-\x1f\ufffe\uffff\ud800-\udfff]|]]>')
+
+# Replacements for converting novx section content into Markdown.
+# The order matters, because some replacements produce others' input.
+NOVX_TO_MD = (
+    ('<Content>', ''),
+    ('</Content>', ''),
+    ('<em> ', ' <em>'),
+    ('<strong> ', ' <strong>'),
+    ('</em><em>', ''),
+    ('</strong><strong>', ''),
+    ('<p>', ''),
+    ('<p style="quotations">', ''),
+    ('</p>', '\n'),
+    ('<em>', '*'),
+    ('</em>', '*'),
+    ('<strong>', '**'),
+    ('</strong>', '**'),
+    ('  ', ' '),
+)
+
+# Regular expressions for removing novx markup that has no Markdown equivalent.
+NOVX_COMMENT = re.compile(r'<comment>.*?</comment>', re.DOTALL)
+NOVX_NOTE = re.compile(r'<note .*?>].*?<\/note>', re.DOTALL)
+NOVX_SPAN = re.compile(r'<span.*?>|</span>')
+
 
 class NovxFile(File):
     """novx file representation.
@@ -55,6 +89,21 @@ class NovxFile(File):
 <?xml-stylesheet href="novx.css" type="text/css"?>
 '''
 
+    _PROJECT_TEXT_PROPERTIES = {
+        'Author':Novel.authorName,
+        'ChapterHeadingPrefix':Novel.chapterHeadingPrefix,
+        'ChapterHeadingSuffix':Novel.chapterHeadingSuffix,
+        'PartHeadingPrefix':Novel.partHeadingPrefix,
+        'PartHeadingSuffix':Novel.partHeadingSuffix,
+        'CustomGoal':Novel.customGoal,
+        'CustomConflict':Novel.customConflict,
+        'CustomOutcome':Novel.customOutcome,
+        'CustomChrBio':Novel.customChrBio,
+        'CustomChrGoals':Novel.customChrGoals,
+        'ReferenceDate':Novel.referenceDate,
+    }
+    # key: project element tag, value: Novel property set from the element text
+
     def __init__(self, filePath, **kwargs):
         """Initialize instance variables.
         
@@ -80,15 +129,21 @@ class NovxFile(File):
 
     def adjust_section_types(self):
         """Make sure that nodes with "Unused" parents inherit the type."""
+        chapters = self.novel.chapters
+        sections = self.novel.sections
+        get_children = self.novel.tree.get_children
         partType = 0
-        for chId in self.novel.tree.get_children(CH_ROOT):
-            if self.novel.chapters[chId].chLevel == 1:
-                partType = self.novel.chapters[chId].chType
-            elif partType != 0 and not self.novel.chapters[chId].isTrash:
-                self.novel.chapters[chId].chType = partType
-            for scId in self.novel.tree.get_children(chId):
-                if self.novel.sections[scId].scType < self.novel.chapters[chId].chType:
-                    self.novel.sections[scId].scType = self.novel.chapters[chId].chType
+        for chId in get_children(CH_ROOT):
+            chapter = chapters[chId]
+            if chapter.chLevel == 1:
+                partType = chapter.chType
+            elif partType != 0 and not chapter.isTrash:
+                chapter.chType = partType
+            chType = chapter.chType
+            for scId in get_children(chId):
+                section = sections[scId]
+                if section.scType < chType:
+                    section.scType = chType
 
     def count_words(self):
         """Return a tuple of word count totals.
@@ -98,13 +153,19 @@ class NovxFile(File):
         """
         count = 0
         totalCount = 0
-        for chId in self.novel.tree.get_children(CH_ROOT):
-            if not self.novel.chapters[chId].isTrash:
-                for scId in self.novel.tree.get_children(chId):
-                    if self.novel.sections[scId].scType < 2:
-                        totalCount += self.novel.sections[scId].wordCount
-                        if self.novel.sections[scId].scType == 0:
-                            count += self.novel.sections[scId].wordCount
+        chapters = self.novel.chapters
+        sections = self.novel.sections
+        get_children = self.novel.tree.get_children
+        for chId in get_children(CH_ROOT):
+            if not chapters[chId].isTrash:
+                for scId in get_children(chId):
+                    section = sections[scId]
+                    scType = section.scType
+                    if scType < 2:
+                        wordCount = section.wordCount
+                        totalCount += wordCount
+                        if scType == 0:
+                            count += wordCount
         return count, totalCount
 
     def read(self):
@@ -171,30 +232,30 @@ class NovxFile(File):
 
         self.xmlTree = ET.ElementTree(xmlRoot)
         self._write_element_tree(self)
-        self._postprocess_xml_file(self.filePath)
         self._get_timestamp()
 
     def _build_chapter_branch(self, xmlChapters, prjChp, chId):
-        xmlChapter = ET.SubElement(xmlChapters, 'CHAPTER', attrib={'id':chId})
 
         #--- Attributes.
+        attrib = {'id':chId}
         if prjChp.chType:
-            xmlChapter.set('type', str(prjChp.chType))
+            attrib['type'] = str(prjChp.chType)
         if prjChp.chLevel == 1:
-            xmlChapter.set('level', '1')
+            attrib['level'] = '1'
         if prjChp.isTrash:
-            xmlChapter.set('isTrash', '1')
+            attrib['isTrash'] = '1'
         if prjChp.noNumber:
-            xmlChapter.set('noNumber', '1')
+            attrib['noNumber'] = '1'
+        xmlChapter = ET.SubElement(xmlChapters, 'CHAPTER', attrib=attrib)
 
         #--- Inherited properties.
         self._set_base_data(xmlChapter, prjChp)
         self._set_notes(xmlChapter, prjChp)
 
         #--- Section branch.
+        sections = self.novel.sections
         for scId in self.novel.tree.get_children(chId):
-            xmlSection = ET.SubElement(xmlChapter, 'SECTION', attrib={'id':scId})
-            self._build_section_branch(xmlSection, self.novel.sections[scId])
+            self._build_section_branch(xmlChapter, sections[scId], scId)
 
         return xmlChapter
 
@@ -231,62 +292,66 @@ class NovxFile(File):
             ET.SubElement(xmlCrt, 'DeathDate').text = prjCrt.deathDate
 
     def _build_element_tree(self, root):
+        SubElement = ET.SubElement
+        novel = self.novel
+        get_children = novel.tree.get_children
 
         #--- Process project properties.
-        xmlProject = ET.SubElement(root, 'PROJECT')
+        xmlProject = SubElement(root, 'PROJECT')
         self._build_project_branch(xmlProject)
 
         #--- Process chapters and sections.
-        xmlChapters = ET.SubElement(root, 'CHAPTERS')
-        for chId in self.novel.tree.get_children(CH_ROOT):
-            self._build_chapter_branch(xmlChapters, self.novel.chapters[chId], chId)
+        xmlChapters = SubElement(root, 'CHAPTERS')
+        for chId in get_children(CH_ROOT):
+            self._build_chapter_branch(xmlChapters, novel.chapters[chId], chId)
 
         #--- Process characters.
-        xmlCharacters = ET.SubElement(root, 'CHARACTERS')
-        for crId in self.novel.tree.get_children(CR_ROOT):
-            xmlCrt = ET.SubElement(xmlCharacters, 'CHARACTER', attrib={'id':crId})
-            self._build_character_branch(xmlCrt, self.novel.characters[crId])
+        xmlCharacters = SubElement(root, 'CHARACTERS')
+        for crId in get_children(CR_ROOT):
+            xmlCrt = SubElement(xmlCharacters, 'CHARACTER', attrib={'id':crId})
+            self._build_character_branch(xmlCrt, novel.characters[crId])
 
         #--- Process locations.
-        xmlLocations = ET.SubElement(root, 'LOCATIONS')
-        for lcId in self.novel.tree.get_children(LC_ROOT):
-            xmlLoc = ET.SubElement(xmlLocations, 'LOCATION', attrib={'id':lcId})
-            self._build_location_branch(xmlLoc, self.novel.locations[lcId])
+        xmlLocations = SubElement(root, 'LOCATIONS')
+        for lcId in get_children(LC_ROOT):
+            xmlLoc = SubElement(xmlLocations, 'LOCATION', attrib={'id':lcId})
+            self._build_location_branch(xmlLoc, novel.locations[lcId])
 
         #--- Process items.
-        xmlItems = ET.SubElement(root, 'ITEMS')
-        for itId in self.novel.tree.get_children(IT_ROOT):
-            xmlItm = ET.SubElement(xmlItems, 'ITEM', attrib={'id':itId})
-            self._build_item_branch(xmlItm, self.novel.items[itId])
+        xmlItems = SubElement(root, 'ITEMS')
+        for itId in get_children(IT_ROOT):
+            xmlItm = SubElement(xmlItems, 'ITEM', attrib={'id':itId})
+            self._build_item_branch(xmlItm, novel.items[itId])
 
         #--- Process plot lines and plot points.
-        xmlPlotLines = ET.SubElement(root, 'ARCS')
-        for plId in self.novel.tree.get_children(PL_ROOT):
-            self._build_plot_line_branch(xmlPlotLines, self.novel.plotLines[plId], plId)
+        xmlPlotLines = SubElement(root, 'ARCS')
+        for plId in get_children(PL_ROOT):
+            self._build_plot_line_branch(xmlPlotLines, novel.plotLines[plId], plId)
 
         #--- Process project notes.
-        xmlProjectNotes = ET.SubElement(root, 'PROJECTNOTES')
-        for pnId in self.novel.tree.get_children(PN_ROOT):
-            xmlProjectNote = ET.SubElement(xmlProjectNotes, 'PROJECTNOTE', attrib={'id':pnId})
-            self._build_project_notes_branch(xmlProjectNote, self.novel.projectNotes[pnId])
+        xmlProjectNotes = SubElement(root, 'PROJECTNOTES')
+        for pnId in get_children(PN_ROOT):
+            xmlProjectNote = SubElement(xmlProjectNotes, 'PROJECTNOTE', attrib={'id':pnId})
+            self._build_project_notes_branch(xmlProjectNote, novel.projectNotes[pnId])
 
         #--- Build the word count log.
         if self.wcLog:
-            xmlWcLog = ET.SubElement(root, 'PROGRESS')
+            xmlWcLog = SubElement(root, 'PROGRESS')
+            saveWordCount = novel.saveWordCount
             wcLastCount = None
             wcLastTotalCount = None
-            for wc in self.wcLog:
-                if self.novel.saveWordCount:
+            for wc, (wcCount, wcTotalCount) in self.wcLog.items():
+                if saveWordCount:
                     # Discard entries with unchanged word count.
-                    if self.wcLog[wc][0] == wcLastCount and self.wcLog[wc][1] == wcLastTotalCount:
+                    if wcCount == wcLastCount and wcTotalCount == wcLastTotalCount:
                         continue
 
-                    wcLastCount = self.wcLog[wc][0]
-                    wcLastTotalCount = self.wcLog[wc][1]
-                xmlWc = ET.SubElement(xmlWcLog, 'WC')
-                ET.SubElement(xmlWc, 'Date').text = wc
-                ET.SubElement(xmlWc, 'Count').text = self.wcLog[wc][0]
-                ET.SubElement(xmlWc, 'WithUnused').text = self.wcLog[wc][1]
+                    wcLastCount = wcCount
+                    wcLastTotalCount = wcTotalCount
+                xmlWc = SubElement(xmlWcLog, 'WC')
+                SubElement(xmlWc, 'Date').text = wc
+                SubElement(xmlWc, 'Count').text = wcCount
+                SubElement(xmlWc, 'WithUnused').text = wcTotalCount
 
     def _build_item_branch(self, xmlItm, prjItm):
 
@@ -317,8 +382,7 @@ class NovxFile(File):
 
         #--- Section references.
         if prjPlotLine.sections:
-            attrib = {'ids':' '.join(prjPlotLine.sections)}
-            ET.SubElement(xmlPlotLine, 'Sections', attrib=attrib)
+            ET.SubElement(xmlPlotLine, 'Sections', ids=' '.join(prjPlotLine.sections))
 
         #--- Plot points.
         for ppId in self.novel.tree.get_children(plId):
@@ -403,17 +467,20 @@ class NovxFile(File):
         #--- Inherited properties.
         self._set_base_data(xmlProjectNote, projectNote)
 
-    def _build_section_branch(self, xmlSection, prjScn):
+    def _build_section_branch(self, xmlChapter, prjScn, scId):
+        SubElement = ET.SubElement
 
         #--- Attributes.
+        attrib = {'id':scId}
         if prjScn.scType:
-            xmlSection.set('type', str(prjScn.scType))
+            attrib['type'] = str(prjScn.scType)
         if prjScn.status > 1:
-            xmlSection.set('status', str(prjScn.status))
+            attrib['status'] = str(prjScn.status)
         if prjScn.scene > 0:
-            xmlSection.set('scene', str(prjScn.scene))
+            attrib['scene'] = str(prjScn.scene)
         if prjScn.appendToPrev:
-            xmlSection.set('append', '1')
+            attrib['append'] = '1'
+        xmlSection = SubElement(xmlChapter, 'SECTION', attrib=attrib)
 
         #--- Inherited properties.
         self._set_base_data(xmlSection, prjScn)
@@ -443,52 +510,72 @@ class NovxFile(File):
 
         #--- Date/Day and Time.
         if prjScn.date:
-            ET.SubElement(xmlSection, 'Date').text = prjScn.date
+            SubElement(xmlSection, 'Date').text = prjScn.date
         elif prjScn.day:
-            ET.SubElement(xmlSection, 'Day').text = prjScn.day
+            SubElement(xmlSection, 'Day').text = prjScn.day
         if prjScn.time:
-            ET.SubElement(xmlSection, 'Time').text = prjScn.time
+            SubElement(xmlSection, 'Time').text = prjScn.time
 
         #--- Duration.
         if prjScn.lastsDays and prjScn.lastsDays != '0':
-            ET.SubElement(xmlSection, 'LastsDays').text = prjScn.lastsDays
+            SubElement(xmlSection, 'LastsDays').text = prjScn.lastsDays
         if prjScn.lastsHours and prjScn.lastsHours != '0':
-            ET.SubElement(xmlSection, 'LastsHours').text = prjScn.lastsHours
+            SubElement(xmlSection, 'LastsHours').text = prjScn.lastsHours
         if prjScn.lastsMinutes and prjScn.lastsMinutes != '0':
-            ET.SubElement(xmlSection, 'LastsMinutes').text = prjScn.lastsMinutes
+            SubElement(xmlSection, 'LastsMinutes').text = prjScn.lastsMinutes
 
         #--- Characters references.
         if prjScn.characters:
-            attrib = {'ids':' '.join(prjScn.characters)}
-            ET.SubElement(xmlSection, 'Characters', attrib=attrib)
+            SubElement(xmlSection, 'Characters', ids=' '.join(prjScn.characters))
 
         #--- Locations references.
         if prjScn.locations:
-            attrib = {'ids':' '.join(prjScn.locations)}
-            ET.SubElement(xmlSection, 'Locations', attrib=attrib)
+            SubElement(xmlSection, 'Locations', ids=' '.join(prjScn.locations))
 
         #--- Items references.
         if prjScn.items:
-            attrib = {'ids':' '.join(prjScn.items)}
-            ET.SubElement(xmlSection, 'Items', attrib=attrib)
+            SubElement(xmlSection, 'Items', ids=' '.join(prjScn.items))
 
         #--- Content.
         sectionContent = prjScn.sectionContent
         if sectionContent:
-            while '\n\n' in sectionContent:
+            if '\n\n' in sectionContent:
                 sectionContent = sectionContent.replace('\n\n', '@%&').strip()
-            while '***' in sectionContent:
-                sectionContent = sectionContent.replace('***', '§%§')
-            sectionContent = re.sub(r'\*\*(.+?)\*\*', '<strong>\\1</strong>', sectionContent)
-            sectionContent = re.sub(r'\*(.+?)\*', '<em>\\1</em>', sectionContent)
-            while '§%§' in sectionContent:
-                sectionContent = sectionContent.replace('§%§', '***')
-            newlines = []
-            for line in sectionContent.split('@%&'):
-                line = f'<p>{line}</p>'
-                newlines.append(line)
-            sectionContent = '\n'.join(newlines)
-            xmlSection.append(ET.fromstring(f'<Content>\n{sectionContent}\n</Content>'))
+                # a single pass leaves no double line breaks
+            sectionContent = sectionContent.replace('***', '§%§')
+            sectionContent = MD_STRONG.sub('<strong>\\1</strong>', sectionContent)
+            sectionContent = MD_EMPHASIS.sub('<em>\\1</em>', sectionContent)
+            sectionContent = sectionContent.replace('§%§', '***')
+            paragraphs = sectionContent.split('@%&')
+            try:
+                xmlContent = self._content_to_xml_element(paragraphs)
+            except ET.ParseError:
+                # markup spanning paragraphs
+                sectionContent = '</p>\n<p>'.join(paragraphs)
+                xmlContent = ET.fromstring(f'<Content>\n<p>{sectionContent}</p>\n</Content>')
+            xmlSection.append(xmlContent)
+
+    def _content_to_xml_element(self, paragraphs):
+        """Return a Content element with a <p> subelement per paragraph.
+        
+        Positional arguments:
+            paragraphs: list of str -- paragraphs with novx inline markup.
+        
+        Only paragraphs matching XML_SPECIAL are run through the XML parser.
+        Raise ET.ParseError if a paragraph is not well-formed.
+        """
+        xmlContent = ET.Element('Content')
+        xmlContent.text = '\n'
+        for paragraph in paragraphs:
+            if XML_SPECIAL.search(paragraph):
+                xmlParagraph = ET.fromstring(f'<p>{paragraph}</p>')
+                xmlContent.append(xmlParagraph)
+            else:
+                xmlParagraph = ET.SubElement(xmlContent, 'p')
+                if paragraph:
+                    xmlParagraph.text = paragraph
+            xmlParagraph.tail = '\n'
+        return xmlContent
 
     def _get_aka(self, xmlElement, prjElement):
         prjElement.aka = self._get_element_text(xmlElement, 'Aka')
@@ -503,8 +590,9 @@ class NovxFile(File):
         
         If the element doesn't exist, return default.
         """
-        if xmlElement.find(tag) is not None:
-            return xmlElement.find(tag).text
+        xmlChild = xmlElement.find(tag)
+        if xmlChild is not None:
+            return xmlChild.text
         else:
             return default
 
@@ -515,14 +603,10 @@ class NovxFile(File):
         """
         links = {}
         for xmlLink in xmlElement.iterfind('Link'):
-            xmlPath = xmlLink.find('Path')
-            if xmlPath is not None:
-                path = xmlPath.text
-                xmlFullPath = xmlLink.find('FullPath')
-                if xmlFullPath is not None:
-                    fullPath = xmlFullPath.text
-                else:
-                    fullPath = None
+            path = xmlLink.findtext('Path')
+            if path is not None:
+                fullPath = xmlLink.findtext('FullPath') or None
+                # findtext() returns an empty string for an empty element
             else:
                 # Read deprecated attributes from DTD 1.3.
                 path = xmlLink.attrib.get('path', None)
@@ -535,14 +619,14 @@ class NovxFile(File):
         prjElement.notes = self._xml_element_to_text(xmlElement.find('Notes'))
 
     def _get_tags(self, xmlElement, prjElement):
-        tags = string_to_list(self._get_element_text(xmlElement, 'Tags'))
-        prjElement.tags = self._strip_spaces(tags)
+        prjElement.tags = string_to_list(self._get_element_text(xmlElement, 'Tags'))
 
     def _get_timestamp(self):
         try:
-            self.timestamp = os.path.getmtime(self.filePath)
-        except:
+            self.timestamp = os.stat(self.filePath).st_mtime
+        except (OSError, TypeError):
             self.timestamp = None
+            # file missing, or no valid file path set
 
     def _keep_word_count(self):
         """Keep the actual wordcount, if not logged."""
@@ -562,187 +646,175 @@ class NovxFile(File):
                 fileDateIso = date.today().isoformat()
             self.wcLogUpdate[fileDateIso] = [actualCount, actualTotalCount]
 
-    def _postprocess_xml_file(self, filePath):
-        """Postprocess an xml file created by ElementTree.
-        
-        Positional argument:
-            filePath: str -- path to xml file.
-        
-        Read the xml file, put a header on top and fix double-escaped text. 
-        Overwrite the .novx xml file.
-        Raise the "Error" exception in case of error. 
-        
-        Note: The path is given as an argument rather than using self.filePath. 
-        So this routine can be used for novelibre-generated xml files other than .novx as well. 
-        """
-        with open(filePath, 'r', encoding='utf-8') as f:
-            text = f.read()
-        # text = unescape(text)
-        # this is because section content PCDATA is "double escaped"
-        try:
-            with open(filePath, 'w', encoding='utf-8') as f:
-                f.write(f'{self.XML_HEADER}{text}')
-        except:
-            raise Error(f'{_("Cannot write file")}: "{norm_path(filePath)}".')
-
     def _read_chapters(self, root):
         """Read data at chapter level from the xml element tree."""
-        try:
-            for xmlChapter in root.find('CHAPTERS'):
-
-                #--- Attributes.
-                chId = xmlChapter.attrib['id']
-                self.novel.chapters[chId] = Chapter(on_element_change=self.on_element_change)
-                typeStr = xmlChapter.get('type', '0')
-                if typeStr in ('0', '1'):
-                    self.novel.chapters[chId].chType = int(typeStr)
-                else:
-                    self.novel.chapters[chId].chType = 1
-                chLevel = xmlChapter.get('level', None)
-                if chLevel == '1':
-                    self.novel.chapters[chId].chLevel = 1
-                else:
-                    self.novel.chapters[chId].chLevel = 2
-                self.novel.chapters[chId].isTrash = xmlChapter.get('isTrash', None) == '1'
-                self.novel.chapters[chId].noNumber = xmlChapter.get('noNumber', None) == '1'
-
-                #--- Inherited properties.
-                self._get_base_data(xmlChapter, self.novel.chapters[chId])
-                self._get_notes(xmlChapter, self.novel.chapters[chId])
-
-                #--- Section branch.
-                self.novel.tree.append(CH_ROOT, chId)
-                for xmlSection in xmlChapter.iterfind('SECTION'):
-                    scId = xmlSection.attrib['id']
-                    self._read_section(xmlSection, scId)
-                    if self.novel.sections[scId].scType < self.novel.chapters[chId].chType:
-                        self.novel.sections[scId].scType = self.novel.chapters[chId].chType
-                    self.novel.tree.append(chId, scId)
-        except TypeError:
-            pass
+        xmlChapters = root.find('CHAPTERS')
+        if xmlChapters is None:
+            return
+
+        for xmlChapter in xmlChapters.iterfind('CHAPTER'):
+
+            #--- Attributes.
+            chId = xmlChapter.attrib['id']
+            chapter = Chapter(on_element_change=self.on_element_change)
+            self.novel.chapters[chId] = chapter
+            typeStr = xmlChapter.get('type', '0')
+            if typeStr in ('0', '1'):
+                chapter.chType = int(typeStr)
+            else:
+                chapter.chType = 1
+            chLevel = xmlChapter.get('level', None)
+            if chLevel == '1':
+                chapter.chLevel = 1
+            else:
+                chapter.chLevel = 2
+            chapter.isTrash = xmlChapter.get('isTrash', None) == '1'
+            chapter.noNumber = xmlChapter.get('noNumber', None) == '1'
+
+            #--- Inherited properties.
+            self._get_base_data(xmlChapter, chapter)
+            self._get_notes(xmlChapter, chapter)
+
+            #--- Section branch.
+            self.novel.tree.append(CH_ROOT, chId)
+            for xmlSection in xmlChapter.iterfind('SECTION'):
+                scId = xmlSection.attrib['id']
+                self._read_section(xmlSection, scId)
+                section = self.novel.sections[scId]
+                if section.scType < chapter.chType:
+                    section.scType = chapter.chType
+                self.novel.tree.append(chId, scId)
 
     def _read_characters(self, root):
         """Read characters from the xml element tree."""
-        try:
-            for xmlCharacter in root.find('CHARACTERS'):
+        xmlCharacters = root.find('CHARACTERS')
+        if xmlCharacters is None:
+            return
 
-                #--- Attributes.
-                crId = xmlCharacter.attrib['id']
-                self.novel.characters[crId] = Character(on_element_change=self.on_element_change)
-                self.novel.characters[crId].isMajor = xmlCharacter.get('major', None) == '1'
+        for xmlCharacter in xmlCharacters.iterfind('CHARACTER'):
 
-                #--- Inherited properties.
-                self._get_base_data(xmlCharacter, self.novel.characters[crId])
-                self._get_notes(xmlCharacter, self.novel.characters[crId])
-                self._get_tags(xmlCharacter, self.novel.characters[crId])
-                self._get_aka(xmlCharacter, self.novel.characters[crId])
+            #--- Attributes.
+            crId = xmlCharacter.attrib['id']
+            character = Character(on_element_change=self.on_element_change)
+            self.novel.characters[crId] = character
+            character.isMajor = xmlCharacter.get('major', None) == '1'
 
-                #--- Full name.
-                self.novel.characters[crId].fullName = self._get_element_text(xmlCharacter, 'FullName')
+            #--- Inherited properties.
+            self._get_base_data(xmlCharacter, character)
+            self._get_notes(xmlCharacter, character)
+            self._get_tags(xmlCharacter, character)
+            self._get_aka(xmlCharacter, character)
 
-                #--- Bio.
-                self.novel.characters[crId].bio = self._xml_element_to_text(xmlCharacter.find('Bio'))
+            #--- Full name.
+            character.fullName = self._get_element_text(xmlCharacter, 'FullName')
 
-                #--- Goals.
-                self.novel.characters[crId].goals = self._xml_element_to_text(xmlCharacter.find('Goals'))
+            #--- Bio.
+            character.bio = self._xml_element_to_text(xmlCharacter.find('Bio'))
 
-                #--- Birth date.
-                self.novel.characters[crId].birthDate = self._get_element_text(xmlCharacter, 'BirthDate')
+            #--- Goals.
+            character.goals = self._xml_element_to_text(xmlCharacter.find('Goals'))
 
-                #--- Death date.
-                self.novel.characters[crId].deathDate = self._get_element_text(xmlCharacter, 'DeathDate')
+            #--- Birth date.
+            character.birthDate = self._get_element_text(xmlCharacter, 'BirthDate')
 
-                self.novel.tree.append(CR_ROOT, crId)
-        except TypeError:
-            pass
+            #--- Death date.
+            character.deathDate = self._get_element_text(xmlCharacter, 'DeathDate')
+
+            self.novel.tree.append(CR_ROOT, crId)
 
     def _read_items(self, root):
         """Read items from the xml element tree."""
-        try:
-            for xmlItem in root.find('ITEMS'):
+        xmlItems = root.find('ITEMS')
+        if xmlItems is None:
+            return
 
-                #--- Attributes.
-                itId = xmlItem.attrib['id']
-                self.novel.items[itId] = WorldElement(on_element_change=self.on_element_change)
+        for xmlItem in xmlItems.iterfind('ITEM'):
 
-                #--- Inherited properties.
-                self._get_base_data(xmlItem, self.novel.items[itId])
-                self._get_notes(xmlItem, self.novel.items[itId])
-                self._get_tags(xmlItem, self.novel.items[itId])
-                self._get_aka(xmlItem, self.novel.items[itId])
+            #--- Attributes.
+            itId = xmlItem.attrib['id']
+            item = WorldElement(on_element_change=self.on_element_change)
+            self.novel.items[itId] = item
 
-                self.novel.tree.append(IT_ROOT, itId)
-        except TypeError:
-            pass
+            #--- Inherited properties.
+            self._get_base_data(xmlItem, item)
+            self._get_notes(xmlItem, item)
+            self._get_tags(xmlItem, item)
+            self._get_aka(xmlItem, item)
+
+            self.novel.tree.append(IT_ROOT, itId)
 
     def _read_locations(self, root):
         """Read locations from the xml element tree."""
-        try:
-            for xmlLocation in root.find('LOCATIONS'):
+        xmlLocations = root.find('LOCATIONS')
+        if xmlLocations is None:
+            return
+
+        for xmlLocation in xmlLocations.iterfind('LOCATION'):
 
-                #--- Attributes.
-                lcId = xmlLocation.attrib['id']
-                self.novel.locations[lcId] = WorldElement(on_element_change=self.on_element_change)
+            #--- Attributes.
+            lcId = xmlLocation.attrib['id']
+            location = WorldElement(on_element_change=self.on_element_change)
+            self.novel.locations[lcId] = location
 
-                #--- Inherited properties.
-                self._get_base_data(xmlLocation, self.novel.locations[lcId])
-                self._get_notes(xmlLocation, self.novel.locations[lcId])
-                self._get_tags(xmlLocation, self.novel.locations[lcId])
-                self._get_aka(xmlLocation, self.novel.locations[lcId])
+            #--- Inherited properties.
+            self._get_base_data(xmlLocation, location)
+            self._get_notes(xmlLocation, location)
+            self._get_tags(xmlLocation, location)
+            self._get_aka(xmlLocation, location)
 
-                self.novel.tree.append(LC_ROOT, lcId)
-        except TypeError:
-            pass
+            self.novel.tree.append(LC_ROOT, lcId)
 
     def _read_plot_lines(self, root):
         """Read plotlines from the xml element tree."""
-        try:
-            for xmlPlotLine in root.find('ARCS'):
-
-                #--- Attributes.
-                plId = xmlPlotLine.attrib['id']
-                self.novel.plotLines[plId] = PlotLine(on_element_change=self.on_element_change)
-
-                #--- Inherited properties.
-                self._get_base_data(xmlPlotLine, self.novel.plotLines[plId])
-                self._get_notes(xmlPlotLine, self.novel.plotLines[plId])
-
-                #--- Short name.
-                self.novel.plotLines[plId].shortName = self._get_element_text(xmlPlotLine, 'ShortName')
-
-                #--- Section references.
-                acSections = []
-                xmlSections = xmlPlotLine.find('Sections')
-                if xmlSections is not None:
-                    scIds = xmlSections.get('ids', None)
-                    for scId in string_to_list(scIds, divider=' '):
-                        if scId and scId in self.novel.sections:
-                            acSections.append(scId)
-                            self.novel.sections[scId].scPlotLines.append(plId)
-                self.novel.plotLines[plId].sections = acSections
-
-                #--- Plot points.
-                self.novel.tree.append(PL_ROOT, plId)
-                for xmlPlotPoint in xmlPlotLine.iterfind('POINT'):
-                    ppId = xmlPlotPoint.attrib['id']
-                    self._read_plot_point(xmlPlotPoint, ppId, plId)
-                    self.novel.tree.append(plId, ppId)
-
-        except TypeError:
-            pass
+        xmlPlotLines = root.find('ARCS')
+        if xmlPlotLines is None:
+            return
+
+        for xmlPlotLine in xmlPlotLines.iterfind('ARC'):
+
+            #--- Attributes.
+            plId = xmlPlotLine.attrib['id']
+            plotLine = PlotLine(on_element_change=self.on_element_change)
+            self.novel.plotLines[plId] = plotLine
+
+            #--- Inherited properties.
+            self._get_base_data(xmlPlotLine, plotLine)
+            self._get_notes(xmlPlotLine, plotLine)
+
+            #--- Short name.
+            plotLine.shortName = self._get_element_text(xmlPlotLine, 'ShortName')
+
+            #--- Section references.
+            acSections = []
+            xmlSections = xmlPlotLine.find('Sections')
+            if xmlSections is not None:
+                scIds = xmlSections.get('ids', None)
+                for scId in string_to_list(scIds, divider=' '):
+                    if scId and scId in self.novel.sections:
+                        acSections.append(scId)
+                        self.novel.sections[scId].scPlotLines.append(plId)
+            plotLine.sections = acSections
+
+            #--- Plot points.
+            self.novel.tree.append(PL_ROOT, plId)
+            for xmlPlotPoint in xmlPlotLine.iterfind('POINT'):
+                ppId = xmlPlotPoint.attrib['id']
+                self._read_plot_point(xmlPlotPoint, ppId, plId)
+                self.novel.tree.append(plId, ppId)
 
     def _read_plot_point(self, xmlPoint, ppId, plId):
         """Read a plot point from the xml element tree."""
-        self.novel.plotPoints[ppId] = PlotPoint(on_element_change=self.on_element_change)
+        plotPoint = PlotPoint(on_element_change=self.on_element_change)
+        self.novel.plotPoints[ppId] = plotPoint
 
         #--- Inherited properties.
-        self._get_base_data(xmlPoint, self.novel.plotPoints[ppId])
+        self._get_base_data(xmlPoint, plotPoint)
 
         #--- Section association.
         xmlSectionAssoc = xmlPoint.find('Section')
         if xmlSectionAssoc is not None:
             scId = xmlSectionAssoc.get('id', None)
-            self.novel.plotPoints[ppId].sectionAssoc = scId
+            plotPoint.sectionAssoc = scId
             self.novel.sections[scId].scPlotPoints[ppId] = plId
 
     def _read_project(self, root):
@@ -765,98 +837,76 @@ class NovxFile(File):
         #--- Inherited properties.
         self._get_base_data(xmlProject, self.novel)
 
-        #--- Author.
-        self.novel.authorName = self._get_element_text(xmlProject, 'Author')
-
-        #--- Chapter heading prefix/suffix.
-        self.novel.chapterHeadingPrefix = self._get_element_text(xmlProject, 'ChapterHeadingPrefix')
-        self.novel.chapterHeadingSuffix = self._get_element_text(xmlProject, 'ChapterHeadingSuffix')
-
-        #--- Part heading prefix/suffix.
-        self.novel.partHeadingPrefix = self._get_element_text(xmlProject, 'PartHeadingPrefix')
-        self.novel.partHeadingSuffix = self._get_element_text(xmlProject, 'PartHeadingSuffix')
-
-        #--- Custom Goal/Conflict/Outcome.
-        self.novel.customGoal = self._get_element_text(xmlProject, 'CustomGoal')
-        self.novel.customConflict = self._get_element_text(xmlProject, 'CustomConflict')
-        self.novel.customOutcome = self._get_element_text(xmlProject, 'CustomOutcome')
-
-        #--- Custom Character Bio/Goals.
-        self.novel.customChrBio = self._get_element_text(xmlProject, 'CustomChrBio')
-        self.novel.customChrGoals = self._get_element_text(xmlProject, 'CustomChrGoals')
-
-        #--- Word count start/Word target.
-        if xmlProject.find('WordCountStart') is not None:
-            self.novel.wordCountStart = int(xmlProject.find('WordCountStart').text)
-        if xmlProject.find('WordTarget') is not None:
-            self.novel.wordTarget = int(xmlProject.find('WordTarget').text)
-
-        #--- Reference date.
-        self.novel.referenceDate = self._get_element_text(xmlProject, 'ReferenceDate')
+        #--- Text fields and word count settings.
+        xmlTexts = {}
+        for xmlElement in xmlProject:
+            xmlTexts.setdefault(xmlElement.tag, xmlElement.text)
+            # like find(), using the first occurrence
+        for tag, classProperty in self._PROJECT_TEXT_PROPERTIES.items():
+            classProperty.fset(self.novel, xmlTexts.get(tag, None))
+        if 'WordCountStart' in xmlTexts:
+            self.novel.wordCountStart = int(xmlTexts['WordCountStart'])
+        if 'WordTarget' in xmlTexts:
+            self.novel.wordTarget = int(xmlTexts['WordTarget'])
 
     def _read_project_notes(self, root):
         """Read project notes from the xml element tree."""
-        try:
-            for xmlProjectNote in root.find('PROJECTNOTES'):
-                pnId = xmlProjectNote.attrib['id']
-                self.novel.projectNotes[pnId] = BasicElement()
+        xmlProjectNotes = root.find('PROJECTNOTES')
+        if xmlProjectNotes is None:
+            return
+
+        for xmlProjectNote in xmlProjectNotes.iterfind('PROJECTNOTE'):
+            pnId = xmlProjectNote.attrib['id']
+            projectNote = BasicElement()
+            self.novel.projectNotes[pnId] = projectNote
 
-                #--- Inherited properties.
-                self._get_base_data(xmlProjectNote, self.novel.projectNotes[pnId])
+            #--- Inherited properties.
+            self._get_base_data(xmlProjectNote, projectNote)
 
-                self.novel.tree.append(PN_ROOT, pnId)
-        except TypeError:
-            pass
+            self.novel.tree.append(PN_ROOT, pnId)
 
     def _read_section(self, xmlSection, scId):
         """Read data at section level from the xml element tree."""
-        self.novel.sections[scId] = Section(on_element_change=self.on_element_change)
+        section = Section(on_element_change=self.on_element_change)
+        self.novel.sections[scId] = section
 
         #--- Attributes.
         typeStr = xmlSection.get('type', '0')
         if typeStr in ('0', '1', '2', '3'):
-            self.novel.sections[scId].scType = int(typeStr)
+            section.scType = int(typeStr)
         else:
-            self.novel.sections[scId].scType = 1
+            section.scType = 1
         status = xmlSection.get('status', None)
         if status in ('2', '3', '4', '5'):
-            self.novel.sections[scId].status = int(status)
+            section.status = int(status)
         else:
-            self.novel.sections[scId].status = 1
+            section.status = 1
 
         scene = xmlSection.get('scene', 0)
         if scene in ('1', '2', '3'):
-            self.novel.sections[scId].scene = int(scene)
+            section.scene = int(scene)
         else:
-            self.novel.sections[scId].scene = 0
+            section.scene = 0
 
-        if not self.novel.sections[scId]:
+        if not section:
             # looking for deprecated attribute from DTD 1.3
             sceneKind = xmlSection.get('pacing', None)
             if sceneKind in ('1', '2'):
-                self.novel.sections[scId].scene = int(sceneKind) + 1
+                section.scene = int(sceneKind) + 1
 
-        self.novel.sections[scId].appendToPrev = xmlSection.get('append', None) == '1'
+        section.appendToPrev = xmlSection.get('append', None) == '1'
 
         #--- Inherited properties.
-        self._get_base_data(xmlSection, self.novel.sections[scId])
-        self._get_notes(xmlSection, self.novel.sections[scId])
-        self._get_tags(xmlSection, self.novel.sections[scId])
+        self._get_base_data(xmlSection, section)
+        self._get_notes(xmlSection, section)
+        self._get_tags(xmlSection, section)
 
         #--- Goal/Conflict/outcome.
-        self.novel.sections[scId].goal = self._xml_element_to_text(xmlSection.find('Goal'))
-        self.novel.sections[scId].conflict = self._xml_element_to_text(xmlSection.find('Conflict'))
-        self.novel.sections[scId].outcome = self._xml_element_to_text(xmlSection.find('Outcome'))
+        section.goal = self._xml_element_to_text(xmlSection.find('Goal'))
+        section.conflict = self._xml_element_to_text(xmlSection.find('Conflict'))
+        section.outcome = self._xml_element_to_text(xmlSection.find('Outcome'))
 
         #--- Plot notes.
-        xmlPlotNotes = xmlSection.find('PlotNotes')
-        if xmlPlotNotes is not None:
-            plotNotes = {}
-            for xmlPlotLineNote in xmlPlotNotes.iterfind('PlotlineNotes'):
-                plId = xmlPlotLineNote.get('id', None)
-                plotNotes[plId] = self._xml_element_to_text(xmlPlotLineNote)
-            self.novel.sections[scId].plotNotes = plotNotes
-
         xmlPlotNotes = xmlSection.find('PlotNotes')
         # looking for deprecated element from DTD 1.3
         if xmlPlotNotes is None:
@@ -865,113 +915,93 @@ class NovxFile(File):
         for xmlPlotLineNote in xmlPlotNotes.iterfind('PlotlineNotes'):
             plId = xmlPlotLineNote.get('id', None)
             plotNotes[plId] = self._xml_element_to_text(xmlPlotLineNote)
-        self.novel.sections[scId].plotlineNotes = plotNotes
+        section.plotlineNotes = plotNotes
 
         #--- Date/Day and Time.
-        if xmlSection.find('Date') is not None:
-            dateStr = xmlSection.find('Date').text
+        xmlDate = xmlSection.find('Date')
+        if xmlDate is not None:
+            dateStr = xmlDate.text
             try:
-                date.fromisoformat(dateStr)
-            except:
-                self.novel.sections[scId].date = None
-            else:
-                self.novel.sections[scId].date = dateStr
-        elif xmlSection.find('Day') is not None:
-            dayStr = xmlSection.find('Day').text
-            try:
-                int(dayStr)
-            except ValueError:
-                self.novel.sections[scId].day = None
+                parse_iso_date(dateStr)
+            except (ValueError, TypeError):
+                section.date = None
             else:
-                self.novel.sections[scId].day = dayStr
+                section.date = dateStr
+        else:
+            xmlDay = xmlSection.find('Day')
+            if xmlDay is not None:
+                dayStr = xmlDay.text
+                try:
+                    int(dayStr)
+                except (ValueError, TypeError):
+                    section.day = None
+                else:
+                    section.day = dayStr
 
-        if xmlSection.find('Time') is not None:
-            timeStr = xmlSection.find('Time').text
+        xmlTime = xmlSection.find('Time')
+        if xmlTime is not None:
+            timeStr = xmlTime.text
             try:
-                time.fromisoformat(timeStr)
-            except:
-                self.novel.sections[scId].time = None
+                parse_iso_time(timeStr)
+            except (ValueError, TypeError):
+                section.time = None
             else:
-                self.novel.sections[scId].time = timeStr
+                section.time = timeStr
 
         #--- Duration.
-        self.novel.sections[scId].lastsDays = self._get_element_text(xmlSection, 'LastsDays')
-        self.novel.sections[scId].lastsHours = self._get_element_text(xmlSection, 'LastsHours')
-        self.novel.sections[scId].lastsMinutes = self._get_element_text(xmlSection, 'LastsMinutes')
+        section.lastsDays = self._get_element_text(xmlSection, 'LastsDays')
+        section.lastsHours = self._get_element_text(xmlSection, 'LastsHours')
+        section.lastsMinutes = self._get_element_text(xmlSection, 'LastsMinutes')
 
         #--- Characters references.
         scCharacters = []
         xmlCharacters = xmlSection.find('Characters')
         if xmlCharacters is not None:
             crIds = xmlCharacters.get('ids', None)
-            for crId in string_to_list(crIds, divider=' '):
-                if crId and crId in self.novel.characters:
-                    scCharacters.append(crId)
-        self.novel.sections[scId].characters = scCharacters
+            characters = self.novel.characters
+            scCharacters = [crId for crId in string_to_list(crIds, divider=' ') if crId in characters]
+        section.characters = scCharacters
 
         #--- Locations references.
         scLocations = []
         xmlLocations = xmlSection.find('Locations')
         if xmlLocations is not None:
             lcIds = xmlLocations.get('ids', None)
-            for lcId in string_to_list(lcIds, divider=' '):
-                if lcId and lcId in self.novel.locations:
-                    scLocations.append(lcId)
-        self.novel.sections[scId].locations = scLocations
+            locations = self.novel.locations
+            scLocations = [lcId for lcId in string_to_list(lcIds, divider=' ') if lcId in locations]
+        section.locations = scLocations
 
         #--- Items references.
         scItems = []
         xmlItems = xmlSection.find('Items')
         if xmlItems is not None:
             itIds = xmlItems.get('ids', None)
-            for itId in string_to_list(itIds, divider=' '):
-                if itId and itId in self.novel.items:
-                    scItems.append(itId)
-        self.novel.sections[scId].items = scItems
+            items = self.novel.items
+            scItems = [itId for itId in string_to_list(itIds, divider=' ') if itId in items]
+        section.items = scItems
 
         #--- Content.
         xmlContent = xmlSection.find('Content')
         if xmlContent is not None:
             text = ET.tostring(
                 xmlContent,
-                encoding='utf-8',
+                encoding='unicode',
                 short_empty_elements=False
-                ).decode('utf-8')
-
-            MD_REPLACEMENTS = [
-                ('<Content>', ''),
-                ('</Content>', ''),
-                ('<em> ', ' <em>'),
-                ('<strong> ', ' <strong>'),
-                ('</em><em>', ''),
-                ('</strong><strong>', ''),
-                ('<p>', ''),
-                ('<p style="quotations">', ''),
-                ('</p>', '\n'),
-                ('<em>', '*'),
-                ('</em>', '*'),
-                ('<strong>', '**'),
-                ('</strong>', '**'),
-                ('  ', ' '),
-            ]
-            for novx, md in MD_REPLACEMENTS:
+                )
+
+            for novx, md in NOVX_TO_MD:
                 text = text.replace(novx, md)
-            text = text.replace('\n', '@%&')
-            text = re.sub(r'<comment>.*?</comment>', '', text)
-            text = re.sub(r'<note .*?>].*?<\/note>', '', text)
-            newlines = []
-            lines = text.split('@%&')
-            for line in lines:
-                newlines.append(line.strip())
-            text = '\n'.join(newlines)
-            text = re.sub(r'<span.*?>|</span>', '', text)
+            text = NOVX_COMMENT.sub('', text)
+            text = NOVX_NOTE.sub('', text)
+            text = '\n'.join([line.strip() for line in text.split('\n')])
+            text = NOVX_SPAN.sub('', text)
             if text:
-                self.novel.sections[scId].sectionContent = f'{text.strip()}\n'
+                section.sectionContent = f'{text.strip()}\n'
             else:
-                self.novel.sections[scId].sectionContent = ''
-        elif self.novel.sections[scId].scType < 2:
+                section.sectionContent = ''
+        elif section.scType < 2:
             # normal or unused section; not a stage
-            self.novel.sections[scId].sectionContent = ''
+            section.sectionContent = ''
 
     def _read_word_count_log(self, xmlRoot):
         """Read the word count log from the xml element tree."""
@@ -1011,19 +1041,6 @@ class NovxFile(File):
         if tagStr:
             ET.SubElement(xmlElement, 'Tags').text = tagStr
 
-    def _strip_spaces(self, lines):
-        """Local helper method.
-
-        Positional argument:
-            lines -- list of strings
-
-        Return lines with leading and trailing spaces removed.
-        """
-        stripped = []
-        for line in lines:
-            stripped.append(line.strip())
-        return stripped
-
     def _text_to_xml_element(self, tag, text):
         """Return an ElementTree element named "tag" with paragraph subelements.
         
@@ -1033,13 +1050,15 @@ class NovxFile(File):
         """
         xmlElement = ET.Element(tag)
         if text:
+            SubElement = ET.SubElement
             for line in text.split('\n'):
-                ET.SubElement(xmlElement, 'p').text = line
+                SubElement(xmlElement, 'p').text = line
         return xmlElement
 
     def _write_element_tree(self, xmlProject):
         """Write back the xml element tree to a .novx xml file located at filePath.
         
+        Put the XML header on top, using the _write_xml_header() hook, then the element tree.
         If a novx file already exists, rename it for backup.
         If writing the file fails, restore the backup copy, if any.
         
@@ -1054,12 +1073,25 @@ class NovxFile(File):
             else:
                 backedUp = True
         try:
-            xmlProject.xmlTree.write(xmlProject.filePath, xml_declaration=False, encoding='utf-8')
-        except Error:
+            with open(xmlProject.filePath, 'w', encoding='utf-8', errors='xmlcharrefreplace') as f:
+                xmlProject._write_xml_header(f)
+                xmlProject.xmlTree.write(f, xml_declaration=False, encoding='unicode')
+        except:
             if backedUp:
                 os.replace(f'{xmlProject.filePath}.bak', xmlProject.filePath)
             raise Error(f'{_("Cannot write file")}: "{norm_path(xmlProject.filePath)}".')
 
+    def _write_xml_header(self, f):
+        """Write the xml header to an xml file created by ElementTree.
+        
+        Positional argument:
+            f -- text stream opened for writing, positioned at the beginning.
+        
+        The element tree is written to the same stream afterwards.
+        This is a hook method that can be overridden by subclasses.
+        """
+        f.write(self.XML_HEADER)
+
     def _xml_element_to_text(self, xmlElement):
         """Return plain text, converted from ElementTree paragraph subelements.
         
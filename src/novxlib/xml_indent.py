@@ -4,6 +4,10 @@ Copyright (c) 2024 Peter Triesberger
 For further information see https://github.com/peter88213/mdnovel
 License: GNU LGPLv3 (https://www.gnu.org/licenses/lgpl-3.0.en.html)
 """
+_PARAGRAPH_LEVEL = 5
+_LINE_BREAKS = tuple(f'\n{level * "  "}' for level in range(_PARAGRAPH_LEVEL + 2))
+# line break plus indentation, by level;
+# the recursion stops at the paragraph level, whose children get one more level
 
 
 def indent(elem, level=0):
@@ -14,19 +18,22 @@ def indent(elem, level=0):
 
     Based on a code example by Fredrik Lundh. 
     """
-    PARAGRAPH_LEVEL = 5
-
-    i = f'\n{level * "  "}'
+    i = _LINE_BREAKS[level]
     if len(elem):
-        if not elem.text or not elem.text.strip():
-            elem.text = f'{i}  '
-        if not elem.tail or not elem.tail.strip():
+        text = elem.text
+        if not text or not text.strip():
+            elem.text = _LINE_BREAKS[level + 1]
+        tail = elem.tail
+        if not tail or not tail.strip():
             elem.tail = i
-        if level < PARAGRAPH_LEVEL:
+        if level < _PARAGRAPH_LEVEL:
+            level += 1
             for elem in elem:
-                indent(elem, level + 1)
-        if not elem.tail or not elem.tail.strip():
+                indent(elem, level)
+        tail = elem.tail
+        if not tail or not tail.strip():
             elem.tail = i
-    else:
-        if level and (not elem.tail or not elem.tail.strip()):
+    elif level:
+        tail = elem.tail
+        if not tail or not tail.strip():
             elem.tail = i
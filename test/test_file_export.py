@@ -0,0 +1,77 @@
+"""Regression test for the template-based file export.
+
+Copyright (c) 2024 Peter Triesberger
+For further information see https://github.com/peter88213/mdnvlib
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from mdnvlib.md.md_file import MdFile
+from mdnvlib.model.chapter import Chapter
+from mdnvlib.model.character import Character
+from mdnvlib.model.novel import Novel
+from mdnvlib.model.nv_tree import NvTree
+from mdnvlib.model.section import Section
+from mdnvlib.model.world_element import WorldElement
+from mdnvlib.novx_globals import CH_ROOT
+from mdnvlib.novx_globals import CR_ROOT
+from mdnvlib.novx_globals import IT_ROOT
+from mdnvlib.novx_globals import LC_ROOT
+
+
+class SectionListFile(MdFile):
+    """Markdown export listing the section's related elements."""
+    _fileHeader = ''
+    _sectionTemplate = '$Characters|$Viewpoint|$Locations|$Items\n'
+
+
+def on_element_change():
+    pass
+
+
+class UntitledElements(unittest.TestCase):
+    """Export a section referencing elements without title."""
+
+    def setUp(self):
+        self.testDir = tempfile.mkdtemp()
+        novel = Novel(tree=NvTree(), on_element_change=on_element_change)
+        novel.chapters['ch1'] = Chapter(title='Chapter', on_element_change=on_element_change)
+        novel.tree.append(CH_ROOT, 'ch1')
+        for crId, title in (('cr1', None), ('cr2', 'Bob')):
+            novel.characters[crId] = Character(title=title, on_element_change=on_element_change)
+            novel.tree.append(CR_ROOT, crId)
+        novel.locations['lc1'] = WorldElement(title=None, on_element_change=on_element_change)
+        novel.tree.append(LC_ROOT, 'lc1')
+        novel.items['it1'] = WorldElement(title='Key', on_element_change=on_element_change)
+        novel.tree.append(IT_ROOT, 'it1')
+        novel.sections['sc1'] = Section(
+            title='Section',
+            scType=0,
+            status=1,
+            scene=0,
+            characters=['cr1', 'cr2'],
+            locations=['lc1'],
+            items=['it1'],
+            on_element_change=on_element_change,
+            )
+        novel.tree.append('ch1', 'sc1')
+        self.exportFile = SectionListFile(os.path.join(self.testDir, 'export.md'))
+        self.exportFile.novel = novel
+
+    def tearDown(self):
+        shutil.rmtree(self.testDir)
+
+    def test_untitled_elements_are_skipped(self):
+        self.exportFile.write()
+        with open(self.exportFile.filePath, encoding='utf-8') as f:
+            text = f.read()
+        self.assertEqual(text, 'Bob|||Key\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+"""Regression test for the Markdown helper functions.
+
+Copyright (c) 2024 Peter Triesberger
+For further information see https://github.com/peter88213/mdnvlib
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from mdnvlib.md.md_helper import sanitize_markdown
+
+
+def sanitize_markdown_loop(text):
+    """Return the result of the former replace loop implementation."""
+    while '\n---' in text:
+        text = text.replace('\n---', '\n???')
+    text = text.replace('@@', '??')
+    text = text.replace('%%', '??')
+    while '\n\n' in text:
+        text = text.replace('\n\n', '\n')
+    text = text.replace('\n', '\n\n').strip()
+    return text
+
+
+class SanitizeMarkdown(unittest.TestCase):
+    """Test sanitize_markdown() against the former implementation."""
+
+    def assert_sanitized(self, text, expected):
+        self.assertEqual(sanitize_markdown(text), expected)
+        self.assertEqual(sanitize_markdown_loop(text), expected)
+
+    def test_one_liners(self):
+        self.assert_sanitized('', '')
+        self.assert_sanitized('One line.', 'One line.')
+        self.assert_sanitized('--- no break before', '--- no break before')
+        self.assert_sanitized('a @@b %%c', 'a ??b ??c')
+
+    def test_markup_escaping(self):
+        self.assert_sanitized('@@ch1\n%%Desc:', '??ch1\n\n??Desc:')
+        self.assert_sanitized('@@@', '??@')
+        self.assert_sanitized('%%%%', '????')
+        self.assert_sanitized('a\n---\nb', 'a\n\n???\n\nb')
+        self.assert_sanitized('a\n-----', 'a\n\n???--')
+        self.assert_sanitized('---\na', '---\n\na')
+
+    def test_blank_lines(self):
+        self.assert_sanitized('a\nb', 'a\n\nb')
+        self.assert_sanitized('a\n\nb', 'a\n\nb')
+        self.assert_sanitized('a\n\n\n\n\nb\n\n\nc', 'a\n\nb\n\nc')
+        self.assert_sanitized('a\n\n\n---', 'a\n\n???')
+
+    def test_surrounding_whitespace(self):
+        self.assert_sanitized('  a  ', 'a')
+        self.assert_sanitized('\n\n  a\nb  \n\n', 'a\n\nb')
+        self.assert_sanitized(' \n a \n ', 'a')
+        self.assert_sanitized('a\n \nb', 'a\n\n \n\nb')
+        self.assert_sanitized('\t\n', '')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+"""Regression test for reading mdnov files.
+
+Copyright (c) 2024 Peter Triesberger
+For further information see https://github.com/peter88213/mdnvlib
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from mdnvlib.mdnov.mdnov_file import MdnovFile
+from mdnvlib.model.novel import Novel
+from mdnvlib.model.nv_tree import NvTree
+
+MDNOV = '''@@book
+
+---
+---
+
+%%
+
+@@ch1
+
+---
+Title: Chapter
+---
+
+%%
+
+@@sc1
+
+---
+Title: One
+---
+
+%%
+
+@@sc2
+
+---
+Title: Two
+---
+
+%%
+
+@@ac1
+
+---
+Title: Main
+ShortName: A
+Sections: sc1
+---
+
+%%
+
+@@ap1
+
+---
+Title: Start
+Section: sc1
+---
+
+%%
+
+@@ac2
+
+---
+Title: Sub
+ShortName: B
+Sections: sc2
+---
+
+%%
+
+@@ap2
+
+---
+Title: Twist
+Section: sc2
+---
+
+%%
+
+@@ap3
+
+---
+Title: Unassigned
+Section: sc9
+---
+
+%%
+'''
+
+
+def on_element_change():
+    pass
+
+
+class PlotPointBackReferences(unittest.TestCase):
+    """Read plot points of several plot lines."""
+
+    def setUp(self):
+        self.testDir = tempfile.mkdtemp()
+        filePath = os.path.join(self.testDir, 'test.mdnov')
+        with open(filePath, 'w', encoding='utf-8') as f:
+            f.write(MDNOV)
+        self.mdnovFile = MdnovFile(filePath)
+        self.mdnovFile.novel = Novel(tree=NvTree(), on_element_change=on_element_change)
+        self.mdnovFile.read()
+
+    def tearDown(self):
+        shutil.rmtree(self.testDir)
+
+    def test_back_references_name_the_own_plot_line(self):
+        sections = self.mdnovFile.novel.sections
+        self.assertEqual(sections['sc1'].scPlotPoints, {'ap1': 'ac1'})
+        self.assertEqual(sections['sc2'].scPlotPoints, {'ap2': 'ac2'})
+        self.assertEqual(sections['sc1'].scPlotLines, ['ac1'])
+        self.assertEqual(sections['sc2'].scPlotLines, ['ac2'])
+
+    def test_unknown_section_is_dropped(self):
+        self.assertIsNone(self.mdnovFile.novel.plotPoints['ap3'].sectionAssoc)
+
+
+if __name__ == '__main__':
+    unittest.main()
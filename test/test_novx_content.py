@@ -0,0 +1,94 @@
+"""Regression test for building the novx section content.
+
+Copyright (c) 2024 Peter Triesberger
+For further information see https://github.com/peter88213/mdnvlib
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+import os
+import sys
+import unittest
+import xml.etree.ElementTree as ET
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from mdnvlib.model.section import Section
+from novxlib.novx_file import NovxFile
+
+COMMENT = '<comment><creator>Me</creator><date>2024-01-01</date><p>Check this.</p></comment>'
+NOTE = '<note id="ftn1" class="footnote"><note-citation>1</note-citation><p>A footnote.</p></note>'
+
+
+def full_parse(paragraphs):
+    """Return the Content element the way it was built before."""
+    sectionContent = '</p>\n<p>'.join(paragraphs)
+    return ET.fromstring(f'<Content>\n<p>{sectionContent}</p>\n</Content>')
+
+
+class ContentElement(unittest.TestCase):
+    """Compare the direct build with the full parse."""
+
+    def setUp(self):
+        self.novxFile = NovxFile('test.novx')
+
+    def assert_same(self, paragraphs):
+        self.assertEqual(
+            ET.tostring(self.novxFile._content_to_xml_element(paragraphs)),
+            ET.tostring(full_parse(paragraphs)),
+            )
+
+    def test_plain_text(self):
+        self.assert_same(['One paragraph.'])
+        self.assert_same(['First.', '', 'Third.'])
+        self.assert_same([''])
+
+    def test_nested_emphasis(self):
+        self.assert_same(['<strong>bold <em>both</em></strong> and <em>italic <strong>both</strong></em>'])
+        self.assert_same(['Plain.', '<em>a</em><strong>b</strong>', 'Plain.'])
+
+    def test_escaping(self):
+        self.assert_same(['Fish &amp; chips', '1 &lt; 2 &gt; 0', 'a > b', 'x ]] y'])
+        xmlContent = self.novxFile._content_to_xml_element(['a &amp; b &lt;c&gt;', 'd > e'])
+        self.assertEqual([p.text for p in xmlContent], ['a & b <c>', 'd > e'])
+        self.assertIn(b'<p>a &amp; b &lt;c&gt;</p>', ET.tostring(xmlContent))
+        self.assertIn(b'<p>d &gt; e</p>', ET.tostring(xmlContent))
+
+    def test_comments_notes_spans(self):
+        self.assert_same([f'Text{COMMENT} more text.'])
+        self.assert_same([f'Text{NOTE} more.', 'Next.'])
+        self.assert_same(['<span xml:lang="de-DE">Hallo</span> world.'])
+        self.assert_same([f'<em>{COMMENT}</em>', f'{NOTE}<span xml:lang="en-US">{COMMENT}</span>'])
+
+    def test_parse_error(self):
+        with self.assertRaises(ET.ParseError):
+            self.novxFile._content_to_xml_element(['<em>starts here', 'ends here</em>'])
+        with self.assertRaises(ET.ParseError):
+            self.novxFile._content_to_xml_element(['Fish & chips'])
+        with self.assertRaises(ET.ParseError):
+            self.novxFile._content_to_xml_element(['One</p><p>Two'])
+
+
+class SectionBranch(unittest.TestCase):
+    """Build the section content from Markdown."""
+
+    def build_content(self, text):
+        section = Section(scType=0, status=1, scene=0, on_element_change=lambda: None)
+        section.sectionContent = text
+        xmlChapter = ET.Element('Chapter')
+        NovxFile('test.novx')._build_section_branch(xmlChapter, section, 'sc1')
+        return xmlChapter.find('SECTION/Content')
+
+    def test_markdown(self):
+        xmlContent = self.build_content('**bold *both* text**\n\nFish &amp; chips')
+        expected = full_parse(['<strong>bold <em>both</em> text</strong>', 'Fish &amp; chips'])
+        self.assertEqual(ET.tostring(xmlContent), ET.tostring(expected))
+
+    def test_parse_error_fallback(self):
+        # novx paragraph markup within a Markdown paragraph
+        text = 'One</p><p style="quotations">Two\n\nThree'
+        xmlContent = self.build_content(text)
+        expected = full_parse(['One</p><p style="quotations">Two', 'Three'])
+        self.assertEqual(ET.tostring(xmlContent), ET.tostring(expected))
+        self.assertEqual([p.text for p in xmlContent], ['One', 'Two', 'Three'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+"""Regression test for the export template substitution.
+
+Copyright (c) 2024 Peter Triesberger
+For further information see https://github.com/peter88213/mdnvlib
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+import os
+from string import Template
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from mdnvlib.file.safe_template import SafeTemplate
+
+MAPPING = dict(Title='Chapter One', ID='ch1', Desc='{braced} text', Count=42)
+
+
+class SafeSubstitute(unittest.TestCase):
+    """Compare SafeTemplate with string.Template."""
+
+    def assert_same(self, template, mapping=MAPPING):
+        self.assertEqual(
+            SafeTemplate(template).safe_substitute(mapping),
+            Template(template).safe_substitute(mapping),
+            )
+
+    def test_plain_text(self):
+        self.assert_same('')
+        self.assert_same('No placeholders\n')
+
+    def test_escapes(self):
+        self.assert_same('$$Title costs $$5')
+        self.assertEqual(SafeTemplate('$$Title').safe_substitute(MAPPING), '$Title')
+        self.assert_same('Stray $ and $1 and trailing $')
+
+    def test_literal_braces(self):
+        self.assert_same('{$Title} {{ID}} }{ {')
+        self.assert_same('{0} {Title} {}')
+        self.assert_same('$Desc')
+        self.assertEqual(SafeTemplate('{$ID}').safe_substitute(MAPPING), '{ch1}')
+
+    def test_named_and_braced(self):
+        self.assert_same('$Title ${Title} ${ID}')
+        self.assertEqual(SafeTemplate('${ID}x').safe_substitute(MAPPING), 'ch1x')
+
+    def test_missing_keys(self):
+        self.assert_same('$Missing ${Missing} $Title')
+        self.assert_same('${Missing}')
+        self.assert_same('$Missing')
+        self.assert_same('$Missing and ${Missing}', {})
+        self.assert_same('$Title and ${Title}', {})
+        self.assertEqual(SafeTemplate('$Missing ${Missing}').safe_substitute({}), '$Missing ${Missing}')
+
+    def test_identifier_characters_after_name(self):
+        # "$IDx" is the placeholder "IDx", not "ID" followed by "x"
+        self.assert_same('$IDx $ID_1 $ID2 $ID.x $ID-x')
+        self.assertEqual(SafeTemplate('$IDx').safe_substitute(MAPPING), '$IDx')
+
+    def test_values(self):
+        self.assert_same('$Count words')
+        self.assert_same('$Title', dict(Title='$ID ${ID} {ID}'))
+
+    def test_reuse(self):
+        template = SafeTemplate('$Title/$ID')
+        self.assertEqual(template.safe_substitute(MAPPING), 'Chapter One/ch1')
+        self.assertEqual(template.safe_substitute(dict(ID='ch2')), '$Title/ch2')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+"""Regression test for the section word counter.
+
+Copyright (c) 2024 Peter Triesberger
+For further information see https://github.com/peter88213/mdnvlib
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from mdnvlib.model.section import Section
+
+
+def count_words(text):
+    section = Section(on_element_change=lambda: None)
+    section.sectionContent = text
+    return section.wordCount
+
+
+class WordCount(unittest.TestCase):
+    """Test the word count of section content."""
+
+    def test_plain_text(self):
+        self.assertEqual(count_words('one two  three\nfour'), 4)
+
+    def test_word_limits(self):
+        self.assertEqual(count_words('one--two—three–four'), 4)
+        self.assertEqual(count_words('one</p>two'), 2)
+
+    def test_markup(self):
+        self.assertEqual(count_words('<em>one</em> two'), 2)
+        self.assertEqual(count_words('one<comment>two three</comment> four'), 2)
+        self.assertEqual(count_words('one<note>two three</note> four'), 2)
+
+    def test_paragraph_end_after_stray_bracket(self):
+        # "</p>" is a word limit before it can be part of a tag
+        self.assertEqual(count_words('<</p>'), 1)
+        self.assertEqual(count_words('<</p>a'), 2)
+        self.assertEqual(count_words('<</p>>'), 0)
+        self.assertEqual(count_words('a <b</p>c> d'), 2)
+
+    def test_no_content(self):
+        self.assertEqual(count_words(None), 0)
+        self.assertEqual(count_words(''), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+"""Regression test for loading element metadata from YAML.
+
+Copyright (c) 2024 Peter Triesberger
+For further information see https://github.com/peter88213/mdnvlib
+License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from mdnvlib.model.plot_line import PlotLine
+from mdnvlib.model.plot_point import PlotPoint
+
+
+class ChangeNotification(unittest.TestCase):
+    """Test the on_element_change calls when loading YAML."""
+
+    def setUp(self):
+        self.changes = 0
+
+    def on_element_change(self):
+        self.changes += 1
+
+    def test_notify_on_change(self):
+        plotPoint = PlotPoint(on_element_change=self.on_element_change)
+        plotPoint.from_yaml(['Section: sc1'])
+        self.assertEqual(plotPoint.sectionAssoc, 'sc1')
+        self.assertEqual(self.changes, 1)
+        plotPoint.from_yaml(['Section: sc2'])
+        self.assertEqual(plotPoint.sectionAssoc, 'sc2')
+        self.assertEqual(self.changes, 2)
+        plotPoint.from_yaml([])
+        self.assertIsNone(plotPoint.sectionAssoc)
+        self.assertEqual(self.changes, 3)
+
+    def test_no_notification_without_change(self):
+        plotLine = PlotLine(on_element_change=self.on_element_change)
+        yaml = ['Title: Main', 'ShortName: A', 'Sections: sc1;sc2']
+        plotLine.from_yaml(yaml)
+        self.assertEqual(plotLine.sections, ('sc1', 'sc2'))
+        changes = self.changes
+        plotLine.from_yaml(yaml)
+        self.assertEqual(self.changes, changes)
+
+
+class SectionReferences(unittest.TestCase):
+    """Test the plot line's section references."""
+
+    def test_constructor_argument(self):
+        plotLine = PlotLine(sections=['sc1', 'sc2'])
+        self.assertEqual(plotLine.sections, ('sc1', 'sc2'))
+        self.assertIsNone(PlotLine().sections)
+
+    def test_same_as_yaml(self):
+        plotLine = PlotLine(sections=['sc1', 'sc2'], on_element_change=self.fail)
+        plotLine.from_yaml(['Sections: sc1;sc2'])
+
+
+if __name__ == '__main__':
+    unittest.main()